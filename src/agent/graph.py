@@ -183,11 +183,13 @@ def create_orders_agent():
 
 def create_products_agent():
     """Create a products agent specialized in product search, details, and comparisons."""
-    from src.agent.tools.product_tools import search_products, get_product_details, check_product_stock, compare_products
+    from src.agent.tools.product_tools import (
+        search_products, get_product_details, get_products_details_batch, check_product_stock, compare_products
+    )
 
     products_agent = create_react_agent(
         model=init_chat_model("openai:gpt-4o-mini", temperature=0.3),
-        tools=[search_products, get_product_details, check_product_stock, compare_products],
+        tools=[search_products, get_product_details, get_products_details_batch, check_product_stock, compare_products],
         prompt=(
             "You are a products specialist responsible for helping customers with product-related inquiries. "
             "Your primary functions include product search, detailed specifications, stock checking, and comparisons.\n\n"
@@ -199,6 +201,7 @@ def create_products_agent():
             "Guidelines:\n"
             "- Use search_products when customers ask about product categories, types, or general searches\n"
             "- Use get_product_details for comprehensive information about specific products\n"
+            "- Use get_products_details_batch when you need details for several products at once\n"
             "- Use check_product_stock for availability and inventory questions\n"
             "- Use compare_products when customers want to compare multiple products\n"
             "- Present technical specifications clearly and highlight key differentiators\n"
@@ -224,6 +227,12 @@ def create_fitments_agent():
     """Create a fitments agent specialized in vehicle-battery compatibility lookup."""
     from src.agent.tools.fitments_tools import find_battery_for_vehicle, find_vehicles_for_battery
 
+    # Optionally pre-embed popular fitment queries (from CSR_WARMUP_QUERIES_PATH) so the
+    # first lookup is warm
+    if os.getenv("CSR_WARMUP") == "1":
+        from src.agent.tools.qdrant_retriever import start_warmup
+        start_warmup()
+
     fitments_agent = create_react_agent(
         model=init_chat_model("openai:gpt-4o-mini", temperature=0.3),
         tools=[find_battery_for_vehicle, find_vehicles_for_battery],
@@ -261,6 +270,7 @@ def create_warranty_returns_agent():
         check_product_warranty_status,
         check_warranty_from_order_data,  # For Amazon/external orders
         lookup_rma_by_order,
+        check_order_warranty_and_rma,
         lookup_rma_by_email,
         get_rma_status,
         get_brand_warranty_info
@@ -272,6 +282,7 @@ def create_warranty_returns_agent():
             check_product_warranty_status,
             check_warranty_from_order_data,  # For Amazon/external orders
             lookup_rma_by_order,
+            check_order_warranty_and_rma,
             lookup_rma_by_email,
             get_rma_status,
             get_brand_warranty_info
@@ -293,6 +304,8 @@ def create_warranty_returns_agent():
             "- The conversation will indicate if order data was extracted from a screenshot\n\n"
             "**For RMA Tracking:**\n"
             "- lookup_rma_by_order(order_number) - Find RMA records by order number\n"
+            "- check_order_warranty_and_rma(order_number) - Warranty status AND RMA records for one order "
+            "in a single call; prefer this when the customer asks about both\n"
             "- lookup_rma_by_email(email) - Find RMA records by customer email\n"
             "- get_rma_status(rma_number) - Get detailed RMA status by RMA number\n\n"
             "**For Policy Information:**\n"
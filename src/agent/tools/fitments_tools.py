@@ -145,12 +145,12 @@ def find_battery_for_vehicle(vehicle_query: str) -> str:
         The primary recommendation includes the SKU for Shopify product lookup.
     """
     try:
-        from src.agent.tools.qdrant_retriever import QdrantFitmentsRetriever
+        from src.agent.tools.qdrant_retriever import get_retriever
 
         logger.info(f"Searching batteries for vehicle: {vehicle_query}")
 
-        # Initialize retriever and search
-        retriever = QdrantFitmentsRetriever()
+        # Reuse the shared retriever and search
+        retriever = get_retriever()
         results = retriever.search_battery_for_vehicle(query=vehicle_query, top_k=10)
 
         # Format and return results
@@ -186,12 +186,12 @@ def find_vehicles_for_battery(battery_model: str) -> str:
         List of compatible vehicles organized by make, with model and year information.
     """
     try:
-        from src.agent.tools.qdrant_retriever import QdrantFitmentsRetriever
+        from src.agent.tools.qdrant_retriever import get_retriever
 
         logger.info(f"Searching vehicles for battery: {battery_model}")
 
-        # Initialize retriever and search
-        retriever = QdrantFitmentsRetriever()
+        # Reuse the shared retriever and search
+        retriever = get_retriever()
         results = retriever.search_vehicles_for_battery(
             battery_model=battery_model,
             top_k=50  # Get more results for vehicle listings
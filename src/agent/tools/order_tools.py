@@ -11,6 +11,7 @@ external platforms (Amazon, eBay, etc.) using GPT-4o vision.
 import logging
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Union
 from langchain_core.tools import tool
 
@@ -27,7 +28,8 @@ from src.agent.tools.supabase_client import (
     query_orders_table,
     query_orders_by_email,
     query_shipments_by_order_id,
-    query_order_items_by_order_id
+    query_order_items_by_order_id,
+    query_order_items_by_order_ids
 )
 
 logger = logging.getLogger(__name__)
@@ -41,9 +43,7 @@ def format_date(date_value: Any) -> str:
 
     try:
         if isinstance(date_value, str):
-            # Parse ISO format date
-            dt = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-            return dt.strftime("%B %d, %Y")
+            return _format_date_str_cached(date_value)
         elif isinstance(date_value, datetime):
             return date_value.strftime("%B %d, %Y")
         else:
@@ -53,6 +53,14 @@ def format_date(date_value: Any) -> str:
         return str(date_value)
 
 
+@lru_cache(maxsize=2048)
+def _format_date_str_cached(date_value: str) -> str:
+    # Order, ship and delivery dates repeat across tool calls in a conversation
+    # Parse ISO format date (ValueError propagates to format_date and isn't cached)
+    dt = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
+    return dt.strftime("%B %d, %Y")
+
+
 def decode_tracking_status(status_code: Any) -> str:
     """
     Decode ShipWorks tracking status code to human-readable text.
@@ -155,14 +163,13 @@ def get_orders_by_email(email: str, limit: int = 5) -> List[Dict[str, Any]]:
         List of order records, sorted by date (most recent first)
     """
     try:
-        # Use case-insensitive email query (already sorted by OrderDate descending)
-        orders = query_orders_by_email(email)
+        # Use case-insensitive email query (sorted by OrderDate descending, limited server-side)
+        orders = query_orders_by_email(email, limit=limit)
 
         if not orders:
             return []
 
-        # Apply limit (orders already sorted by utility function)
-        return orders[:limit]
+        return orders
 
     except Exception as e:
         logger.error(f"Error getting orders for email {email}: {e}")
@@ -642,9 +649,12 @@ def get_order_items(order_id: Union[str, int]) -> str:
             if not orders:
                 return f"No orders found for email {order_identifier}. Please verify the email address and try again."
 
-            # Collect items from all orders
+            # Collect items from all orders (one query for every order's items)
             all_items_details = []
             all_items_details.append(f"Products ordered by {order_identifier}:\n")
+            items_by_order = query_order_items_by_order_ids(
+                [order["OrderID"] for order in orders if order.get("OrderID")]
+            )
 
             for order in orders:
                 order_num = order.get("OrderNumberComplete") or order.get("OrderNumber") or order.get("OrderID")
@@ -654,8 +664,7 @@ def get_order_items(order_id: Union[str, int]) -> str:
                 if not order_id_val:
                     continue
 
-                # Get items for this order
-                items = query_order_items_by_order_id(order_id_val)
+                items = items_by_order.get(order_id_val)
 
                 if items:
                     all_items_details.append(f"\nOrder #{order_num} ({order_date}):")
@@ -26,7 +26,8 @@ from datetime import datetime
 from src.agent.tools.supabase_client import (
     get_supabase_client,
     query_orders_table,
-    query_order_items_by_order_id
+    query_order_items_by_order_id,
+    query_order_with_items
 )
 
 logger = logging.getLogger(__name__)
@@ -65,10 +66,10 @@ def get_order_with_items(order_identifier: str) -> Optional[Dict[str, Any]]:
         }
     """
     try:
-        logger.info(f"[order_utils] Getting order with items for: {order_identifier}")
+        logger.info("[order_utils] Getting order with items for: %s", order_identifier)
 
-        # Try as order number first
-        orders = query_orders_table("OrderNumberComplete", str(order_identifier))
+        # Try as order number first (order and items in one round trip)
+        orders = query_order_with_items("OrderNumberComplete", str(order_identifier))
 
         # If not found and looks like email, try email lookup
         if (not orders or len(orders) == 0) and "@" in order_identifier:
@@ -82,35 +83,49 @@ def get_order_with_items(order_identifier: str) -> Optional[Dict[str, Any]]:
                 )
 
         if not orders or len(orders) == 0:
-            logger.warning(f"[order_utils] No order found for: {order_identifier}")
+            logger.warning("[order_utils] No order found for: %s", order_identifier)
             return None
 
         order = orders[0]
         order_id = order.get("OrderID")
 
-        # Get order items
-        items = query_order_items_by_order_id(order_id)
+        # Get order items (already embedded for order-number lookups)
+        items = order["items"] if "items" in order else query_order_items_by_order_id(order_id)
 
         # Build structured result
-        result = {
-            "order_id": order_id,
-            "order_number": order.get("OrderNumberComplete") or order.get("OrderNumber"),
-            "order_date": order.get("OrderDate"),
-            "customer_name": order.get("BillFirstName", "") + " " + order.get("BillLastName", ""),
-            "customer_email": order.get("BillEmail"),
-            "order_total": order.get("OrderTotal"),
-            "status": order.get("OnlineStatus", "Unknown"),
-            "items": items or []
-        }
+        result = build_order_with_items(order, items)
 
-        logger.info(f"[order_utils] Found order {result['order_number']} with {len(result['items'])} items")
+        logger.info("[order_utils] Found order %s with %s items", result['order_number'], len(result['items']))
         return result
 
     except Exception as e:
-        logger.error(f"[order_utils] Error getting order {order_identifier}: {e}")
+        logger.error("[order_utils] Error getting order %s: %s", order_identifier, e)
         return None
 
 
+def build_order_with_items(order: Dict[str, Any], items: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Shape a shipworks_order record and its items like get_order_with_items does.
+
+    Args:
+        order: Order record from the database
+        items: The order's item records
+
+    Returns:
+        Dictionary with order info and items (see get_order_with_items)
+    """
+    return {
+        "order_id": order.get("OrderID"),
+        "order_number": order.get("OrderNumberComplete") or order.get("OrderNumber"),
+        "order_date": order.get("OrderDate"),
+        "customer_name": order.get("BillFirstName", "") + " " + order.get("BillLastName", ""),
+        "customer_email": order.get("BillEmail"),
+        "order_total": order.get("OrderTotal"),
+        "status": order.get("OnlineStatus", "Unknown"),
+        "items": items or []
+    }
+
+
 def get_order_date_and_skus(order_number: str) -> Optional[Dict[str, Any]]:
     """
     Get minimal order info: just date and product SKUs.
@@ -142,7 +157,22 @@ def get_order_date_and_skus(order_number: str) -> Optional[Dict[str, Any]]:
         }
 
     except Exception as e:
-        logger.error(f"[order_utils] Error getting date/SKUs for order {order_number}: {e}")
+        logger.error("[order_utils] Error getting date/SKUs for order %s: %s", order_number, e)
+        return None
+
+
+def _parse_numeric_date(value: str) -> Optional[datetime]:
+    """Parse %Y-%m-%d or %m/%d/%Y dates (unpadded fields allowed) without strptime."""
+    separator = "-" if "-" in value else "/"
+    parts = value.split(separator)
+    if len(parts) != 3 or not all(part.isdigit() and part.isascii() for part in parts):
+        return None
+    year, month, day = parts if separator == "-" else (parts[2], parts[0], parts[1])
+    if len(year) != 4 or not 0 < len(month) <= 2 or not 0 < len(day) <= 2:
+        return None
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
         return None
 
 
@@ -164,20 +194,19 @@ def format_order_date(date_value: Any) -> str:
             # Try ISO format
             try:
                 dt = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-                return dt.strftime("%B %d, %Y")
-            except:
+            except ValueError:
                 # Try other formats
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S"]:
+                dt = _parse_numeric_date(date_value)
+                if dt is None and " " in date_value:
                     try:
-                        dt = datetime.strptime(date_value, fmt)
-                        return dt.strftime("%B %d, %Y")
-                    except:
-                        continue
-                return date_value
+                        dt = datetime.strptime(date_value, "%Y-%m-%d %H:%M:%S")
+                    except ValueError:
+                        pass
+            return dt.strftime("%B %d, %Y") if dt is not None else date_value
         elif isinstance(date_value, datetime):
             return date_value.strftime("%B %d, %Y")
         else:
             return str(date_value)
     except Exception as e:
-        logger.warning(f"[order_utils] Error formatting date {date_value}: {e}")
+        logger.warning("[order_utils] Error formatting date %s: %s", date_value, e)
         return str(date_value)
@@ -8,16 +8,45 @@ stored in Qdrant Cloud, supporting bidirectional queries:
 Uses OpenAI's text-embedding-ada-002 for query embeddings (1536 dimensions).
 """
 
+import base64
+import hashlib
 import os
 import logging
 import re
-from typing import List, Dict, Any, Optional
-
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+import httpx
+import numpy as np
 from dotenv import load_dotenv
 from qdrant_client import QdrantClient
-from qdrant_client.models import Filter, FieldCondition, MatchValue
+from qdrant_client.models import (
+    Filter,
+    FieldCondition,
+    MatchAny,
+    MatchValue,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
+)
 from openai import OpenAI
-from supabase import create_client, Client
+from supabase import Client
+
+from src.agent.tools.supabase_client import get_supabase_client
+
+# HTTP/2 needs the optional h2 package; fall back to pooled HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 # Load environment variables
 load_dotenv()
@@ -26,7 +55,329 @@ logger = logging.getLogger(__name__)
 
 # Constants
 COLLECTION_NAME = "chrome_fitments"
-EMBEDDING_MODEL = "text-embedding-ada-002"
+# The collection must be indexed with the same model and dimensionality used for
+# queries. Switching to e.g. text-embedding-3-small with 512 dims requires
+# reindexing chrome_fitments with a matching VectorParams(size=512).
+EMBEDDING_MODEL = os.getenv("FITMENTS_EMBEDDING_MODEL", "text-embedding-ada-002")
+EMBEDDING_DIMS = int(os.getenv("FITMENTS_EMBEDDING_DIMS", "0")) or None
+
+# Fixed payload filters on the record type, built once instead of on every query
+_VEHICLE_TYPE_FILTER = Filter(
+    must=[FieldCondition(key="type", match=MatchValue(value="vehicle_to_battery"))]
+)
+_BATTERY_TYPE_CONDITION = FieldCondition(key="type", match=MatchValue(value="battery_to_vehicle"))
+_BATTERY_TYPE_FILTER = Filter(must=[_BATTERY_TYPE_CONDITION])
+_TYPE_FILTERS = {
+    "vehicle_to_battery": _VEHICLE_TYPE_FILTER,
+    "battery_to_vehicle": _BATTERY_TYPE_FILTER,
+}
+
+# Search quantized vectors first, then rescore an oversampled candidate set with the
+# original vectors. Qdrant ignores this until chrome_fitments has a quantization_config
+# (see QdrantFitmentsRetriever.enable_quantization). FITMENTS_HNSW_EF overrides the
+# collection's ef for queries (0 = collection default).
+FITMENTS_HNSW_EF = int(os.getenv("FITMENTS_HNSW_EF", "0")) or None
+_SEARCH_PARAMS = SearchParams(
+    hnsw_ef=FITMENTS_HNSW_EF,
+    quantization=QuantizationSearchParams(ignore=False, rescore=True, oversampling=2.0)
+)
+
+# Process-wide LRU cache of query embeddings keyed by (model, normalized query).
+# Vectors are kept as contiguous float32 arrays rather than lists of Python floats.
+_EMBEDDING_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+# Optional on-disk embedding cache (SQLite) so the in-process cache is warm again after
+# a restart or redeploy. Opt in by setting FITMENTS_EMBEDDING_CACHE_PATH to a file on
+# persistent storage; the in-process cache already covers repeats within a process.
+_EMBEDDING_DISK_CACHE_PATH = os.getenv("FITMENTS_EMBEDDING_CACHE_PATH", "")
+_EMBEDDING_DISK_CACHE_TTL = int(os.getenv("FITMENTS_EMBEDDING_CACHE_TTL", str(30 * 86400)))
+_EMBEDDING_DISK_CACHE_ENABLED = bool(_EMBEDDING_DISK_CACHE_PATH) and _EMBEDDING_DISK_CACHE_TTL > 0
+# One connection shared by all threads; every use holds the lock
+_embedding_disk_cache_conn: Optional[sqlite3.Connection] = None
+_embedding_disk_cache_lock = threading.Lock()
+
+# gRPC has lower per-request overhead than REST but needs the cluster's gRPC port
+# (6334 on Qdrant Cloud) to be reachable, so it is opt-in
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "").lower() in ("1", "true", "yes")
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+
+# Connection pool for the OpenAI embedding clients: warm calls reuse an open TLS
+# connection instead of paying a fresh handshake
+_OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+_OPENAI_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Query embeddings are fetched with a raw POST (base64 float32 payload, no SDK response
+# models); the SDK, with its retries, is only used when that request fails
+_OPENAI_EMBEDDINGS_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1").rstrip("/") + "/embeddings"
+
+
+# Query parsing for _extract_search_terms
+_YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')  # 4-digit year, 1900-2099
+_TOKEN_SPLIT_RE = re.compile(r'[\s\-/,]+')  # spaces, hyphens, slashes, commas
+
+# Known vehicle types to filter out (not useful for matching)
+_VEHICLE_TYPES = frozenset({
+    'motorcycle', 'atv', 'scooter', 'snowmobile', 'utv',
+    'pwc', 'jet ski', 'side-by-side', 'dirt bike', 'bike'
+})
+
+# Known makes for identification (common powersports manufacturers)
+_KNOWN_MAKES = frozenset({
+    'honda', 'yamaha', 'kawasaki', 'suzuki', 'bmw', 'ducati', 'ktm',
+    'harley', 'triumph', 'aprilia', 'indian', 'victory', 'moto guzzi',
+    'arctic cat', 'polaris', 'can-am', 'sea-doo', 'ski-doo', 'bombardier',
+    'aeon', 'benzai', 'kymco', 'sym', 'piaggio', 'vespa', 'peugeot',
+    'husqvarna', 'beta', 'gas gas', 'sherco', 'tm', 'royal enfield',
+    'cfmoto', 'linhai', 'hisun', 'massimo', 'argo', 'textron'
+})
+# First words of two-word makes ("arctic" for "arctic cat"); a query can only start
+# with a compound make if its first token is one of these
+_COMPOUND_MAKE_FIRSTS = frozenset(make.split()[0] for make in _KNOWN_MAKES if ' ' in make)
+
+# Supabase keyword fallback: try Postgres full-text search on chrome_fitments.model
+# before the ILIKE scan. Opt in with SUPABASE_FITMENTS_FTS=1 once the index exists;
+# without it every query computes each row's tsvector:
+#   create index chrome_fitments_model_fts on chrome_fitments
+#   using gin (to_tsvector('simple', model));
+SUPABASE_FITMENTS_FTS = os.getenv("SUPABASE_FITMENTS_FTS", "0").lower() in ("1", "true", "yes")
+_TSQUERY_UNSAFE_RE = re.compile(r'\W')  # tsquery operators and punctuation
+
+# Seed queries file for warmup(): one query per line, as logged by the app; "#" starts
+# a comment. There is no default file, so warmup needs this path to do anything.
+_WARMUP_QUERIES_PATH = os.getenv("CSR_WARMUP_QUERIES_PATH", "")
+
+
+# Translation table that deletes dashes in a single pass
+_DASH_TABLE = str.maketrans("", "", "-")
+
+
+def _norm_model(model_upper: str) -> str:
+    """Normalize an uppercased battery model for comparison: no -BS suffix, no dashes."""
+    return model_upper.removesuffix("-BS").translate(_DASH_TABLE)
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse surrounding and repeated whitespace so equivalent queries share a cache entry."""
+    return " ".join(query.split())
+
+
+def _load_warmup_queries(path: str) -> List[str]:
+    """Read seed queries from a text file, skipping blank lines and comments.
+
+    Returns:
+        The queries, or an empty list (with a warning) if no path is set or the file does not exist
+    """
+    if not path:
+        logger.warning("Embedding warmup skipped: CSR_WARMUP_QUERIES_PATH is not set")
+        return []
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = [line.strip() for line in f]
+    except FileNotFoundError:
+        logger.warning(f"Embedding warmup skipped: queries file not found: {path}")
+        return []
+    return [line for line in lines if line and not line.startswith("#")]
+
+
+def _disk_cache_key(text: str) -> str:
+    """Stable key for a normalized query under the current embedding model and size."""
+    return hashlib.sha256(f"{EMBEDDING_MODEL}\0{EMBEDDING_DIMS or ''}\0{text}".encode()).hexdigest()
+
+
+def _embedding_disk_cache_connection() -> sqlite3.Connection:
+    """Return the shared cache connection, opening it (and pruning expired rows) on first use.
+
+    Callers must hold _embedding_disk_cache_lock.
+    """
+    global _embedding_disk_cache_conn
+    if _embedding_disk_cache_conn is None:
+        conn = sqlite3.connect(_EMBEDDING_DISK_CACHE_PATH, timeout=5, check_same_thread=False)
+        try:
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS emb_cache "
+                    "(key TEXT PRIMARY KEY, vec BLOB NOT NULL, expires_at REAL NOT NULL)"
+                )
+                conn.execute("DELETE FROM emb_cache WHERE expires_at <= ?", (time.time(),))
+        except sqlite3.Error:
+            conn.close()
+            raise
+        _embedding_disk_cache_conn = conn
+    return _embedding_disk_cache_conn
+
+
+def _disk_cache_get(texts: List[str]) -> Dict[str, np.ndarray]:
+    """Return cached vectors for the given texts from disk; misses and errors are skipped."""
+    if not _EMBEDDING_DISK_CACHE_ENABLED or not texts:
+        return {}
+    keys = {_disk_cache_key(text): text for text in texts}
+    try:
+        with _embedding_disk_cache_lock:
+            rows = _embedding_disk_cache_connection().execute(
+                f"SELECT key, vec FROM emb_cache WHERE expires_at > ? "
+                f"AND key IN ({','.join('?' * len(keys))})",
+                (time.time(), *keys)
+            ).fetchall()
+    except sqlite3.Error as e:
+        logger.warning(f"Embedding disk cache read failed: {e}")
+        return {}
+    return {keys[key]: np.frombuffer(vec, dtype=np.float32) for key, vec in rows}
+
+
+def _disk_cache_set(vectors: Dict[str, np.ndarray]) -> None:
+    """Persist freshly computed vectors to the on-disk cache."""
+    if not _EMBEDDING_DISK_CACHE_ENABLED or not vectors:
+        return
+    expires_at = time.time() + _EMBEDDING_DISK_CACHE_TTL
+    try:
+        with _embedding_disk_cache_lock:
+            conn = _embedding_disk_cache_connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO emb_cache (key, vec, expires_at) VALUES (?, ?, ?)",
+                    [(_disk_cache_key(text), vector.tobytes(), expires_at)
+                     for text, vector in vectors.items()]
+                )
+    except sqlite3.Error as e:
+        logger.warning(f"Embedding disk cache write failed: {e}")
+
+
+def _cached_embeddings(normalized: List[str]) -> Tuple[Dict[str, np.ndarray], List[str]]:
+    """Look up normalized queries in the in-process cache, then the on-disk cache.
+
+    Returns:
+        Tuple of (embeddings found in the cache, distinct texts still to embed)
+    """
+    embeddings: Dict[str, np.ndarray] = {}
+    with _embedding_cache_lock:
+        for text in normalized:
+            cached = _embedding_cache.get((EMBEDDING_MODEL, text))
+            if cached is not None:
+                _embedding_cache.move_to_end((EMBEDDING_MODEL, text))
+                embeddings[text] = cached
+
+    misses = [text for text in dict.fromkeys(normalized) if text not in embeddings]
+    if misses:
+        from_disk = _disk_cache_get(misses)
+        if from_disk:
+            _remember_embeddings(from_disk, embeddings)
+            misses = [text for text in misses if text not in from_disk]
+    logger.debug(f"Embedding cache: {len(normalized) - len(misses)} hits, {len(misses)} misses")
+    return embeddings, misses
+
+
+def _embedding_request(misses: List[str]) -> Dict[str, Any]:
+    """Keyword arguments for an OpenAI embeddings.create call."""
+    request: Dict[str, Any] = {"model": EMBEDDING_MODEL, "input": misses}
+    # ada-002 does not accept `dimensions`, so only send it when configured
+    if EMBEDDING_DIMS:
+        request["dimensions"] = EMBEDDING_DIMS
+    return request
+
+
+def _unit_vector(embedding: Any) -> np.ndarray:
+    """Convert an embedding to a contiguous float32 array with unit L2 norm."""
+    vector = np.array(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm:
+        vector /= norm
+    return vector
+
+
+def _response_vectors(texts: List[str], data: List[Any]) -> Dict[str, np.ndarray]:
+    """Map each input text of an embeddings response to its unit float32 vector."""
+    # The API returns one item per input, tagged with its input index
+    return {texts[item.index]: _unit_vector(item.embedding) for item in data}
+
+
+def _decode_embeddings(texts: List[str], response: httpx.Response) -> Optional[Dict[str, np.ndarray]]:
+    """Map each input text of a raw base64 embeddings response to its unit float32 vector.
+
+    Returns None for a non-200 response, so the caller can retry through the SDK.
+    """
+    if response.status_code != 200:
+        logger.warning(f"Raw embeddings request returned HTTP {response.status_code}, retrying via SDK")
+        return None
+    return {
+        texts[item["index"]]: _unit_vector(np.frombuffer(base64.b64decode(item["embedding"]), dtype=np.float32))
+        for item in response.json()["data"]
+    }
+
+
+def _remember_embeddings(vectors: Dict[str, np.ndarray], embeddings: Dict[str, np.ndarray]) -> None:
+    """Add vectors to the caller's results and to the in-process cache."""
+    with _embedding_cache_lock:
+        for text, vector in vectors.items():
+            embeddings[text] = vector
+            _embedding_cache[(EMBEDDING_MODEL, text)] = vector
+        while len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+
+def _store_embeddings(vectors: Dict[str, np.ndarray], embeddings: Dict[str, np.ndarray]) -> None:
+    """Add freshly computed vectors to the caller's results and to both caches."""
+    _remember_embeddings(vectors, embeddings)
+    _disk_cache_set(vectors)
+
+
+@lru_cache(maxsize=512)
+def _parse_search_terms(query: str) -> Tuple[Optional[str], Optional[str], Tuple[str, ...], frozenset, Tuple[str, ...]]:
+    """Parse a vehicle query into (year, make, model_terms, model_terms_set, all_terms).
+
+    Memoized: the same query text is parsed repeatedly across retries, fallbacks
+    and identical tool calls within a conversation.
+    """
+    # Normalize query: lowercase, strip whitespace
+    normalized = query.lower().strip()
+
+    # Extract 4-digit year if present (1900-2099)
+    year_match = _YEAR_RE.search(normalized)
+    year = year_match.group(1) if year_match else None
+
+    # Remove year from query for further processing
+    query_without_year = _YEAR_RE.sub('', normalized).strip()
+
+    # Tokenize and filter - split on spaces, hyphens, slashes, commas
+    tokens = _TOKEN_SPLIT_RE.split(query_without_year)
+    tokens = [t for t in tokens if t]
+
+    # Filter out vehicle types
+    significant_tokens = [t for t in tokens if t not in _VEHICLE_TYPES]
+
+    # Check if first token is a known make
+    make = None
+    model_terms = significant_tokens.copy()
+    if significant_tokens:
+        first_token = significant_tokens[0]
+        if first_token in _KNOWN_MAKES:
+            make = first_token
+            model_terms = significant_tokens[1:]  # Remaining tokens are model
+        # Handle compound makes like "Arctic Cat" or "Can-Am"
+        elif len(significant_tokens) >= 2 and first_token in _COMPOUND_MAKE_FIRSTS:
+            compound = f"{significant_tokens[0]} {significant_tokens[1]}"
+            if compound in _KNOWN_MAKES:
+                make = compound
+                model_terms = significant_tokens[2:]
+
+    return year, make, tuple(model_terms), frozenset(model_terms), tuple(significant_tokens)
+
+
+def _candidate_pages(top_k: int) -> List[Tuple[int, int]]:
+    """(offset, limit) pages covering the first max(50, top_k * 10) hits in growing steps.
+
+    Vehicle searches fetch one page at a time and stop as soon as the top_k ranking
+    can no longer change, so high-confidence queries only pay for the first page.
+    """
+    total = max(50, top_k * 10)
+    pages = []
+    start = 0
+    for end in sorted({min(top_k * 2, total), min(top_k * 5, total), total}):
+        if end > start:
+            pages.append((start, end - start))
+            start = end
+    return pages
 
 
 class QdrantFitmentsRetriever:
@@ -38,12 +389,12 @@ class QdrantFitmentsRetriever:
     """
 
     def __init__(self):
-        """Initialize Qdrant Cloud connection and OpenAI client."""
+        """Validate Qdrant Cloud and OpenAI credentials; clients are created lazily."""
         qdrant_url = os.getenv("QDRANT_URL")
         qdrant_api_key = os.getenv("QDRANT_API_KEY")
         openai_api_key = os.getenv("OPENAI_API_KEY")
 
-        if not all([qdrant_url, qdrant_api_key]):
+        if not qdrant_url or not qdrant_api_key:
             raise ValueError(
                 "Missing Qdrant Cloud credentials. "
                 "Required: QDRANT_URL, QDRANT_API_KEY"
@@ -55,40 +406,191 @@ class QdrantFitmentsRetriever:
             )
 
         # Remove quotes if present (from .env file)
-        qdrant_url = qdrant_url.strip('"').strip("'")
-        qdrant_api_key = qdrant_api_key.strip('"').strip("'")
+        qdrant_url = qdrant_url.strip("\"'")
+        qdrant_api_key = qdrant_api_key.strip("\"'")
+
+        # Network clients are created on first use, so building the retriever is
+        # cheap and processes only pay for the clients they actually call
+        self._qdrant_url = qdrant_url
+        self._qdrant_api_key = qdrant_api_key
+        self._openai_api_key = openai_api_key
+        self._qdrant_client: Optional[QdrantClient] = None
+        self._openai_client: Optional[OpenAI] = None
+        self._openai_http: Optional[httpx.Client] = None
+
+        # Supabase client for fallback queries
+        self._supabase_url = os.getenv("SUPABASE_URL")
+        self._supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
+        self._supabase: Optional[Client] = None
+        if not (self._supabase_url and self._supabase_key):
+            logger.warning("Supabase credentials not found - fallback queries disabled")
 
-        self.qdrant_client = QdrantClient(
-            url=qdrant_url,
-            api_key=qdrant_api_key
+        logger.info(
+            f"Configured Qdrant Cloud collection: {COLLECTION_NAME} "
+            f"({'gRPC' if QDRANT_PREFER_GRPC else 'REST'})"
         )
-        self.openai_client = OpenAI(api_key=openai_api_key)
 
-        # Initialize Supabase client for fallback queries
-        supabase_url = os.getenv("SUPABASE_URL")
-        supabase_key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
-        if supabase_url and supabase_key:
-            self.supabase: Optional[Client] = create_client(supabase_url, supabase_key)
-        else:
-            self.supabase = None
-            logger.warning("Supabase credentials not found - fallback queries disabled")
+    @property
+    def qdrant_client(self) -> QdrantClient:
+        """Qdrant Cloud client."""
+        if self._qdrant_client is None:
+            self._qdrant_client = QdrantClient(
+                url=self._qdrant_url,
+                api_key=self._qdrant_api_key,
+                prefer_grpc=QDRANT_PREFER_GRPC,
+                grpc_port=QDRANT_GRPC_PORT,
+                timeout=30
+            )
+        return self._qdrant_client
+
+    @property
+    def openai_http(self) -> httpx.Client:
+        """Pooled keep-alive HTTP client for OpenAI, shared by raw requests and the SDK."""
+        if self._openai_http is None:
+            self._openai_http = httpx.Client(
+                http2=HTTP2_AVAILABLE,
+                limits=_OPENAI_HTTP_LIMITS,
+                timeout=_OPENAI_HTTP_TIMEOUT,
+                headers={"Authorization": f"Bearer {self._openai_api_key}"}
+            )
+        return self._openai_http
+
+    @property
+    def openai_client(self) -> OpenAI:
+        """OpenAI client on a pooled keep-alive HTTP connection."""
+        if self._openai_client is None:
+            self._openai_client = OpenAI(
+                api_key=self._openai_api_key,
+                http_client=self.openai_http
+            )
+        return self._openai_client
+
+    @property
+    def supabase(self) -> Optional[Client]:
+        """Supabase client for keyword fallback queries, or None without credentials.
+
+        Shares the process-wide client (and its connection pool) with the order tools.
+        """
+        if self._supabase is None and self._supabase_url and self._supabase_key:
+            self._supabase = get_supabase_client()
+        return self._supabase
+
+    def _create_embeddings(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """Embed texts with one raw OpenAI request, falling back to the SDK on failure.
+
+        Args:
+            texts: Normalized texts missing from the embedding caches
+
+        Returns:
+            Mapping of each text to its unit float32 vector
+        """
+        vectors = None
+        try:
+            response = self.openai_http.post(
+                _OPENAI_EMBEDDINGS_URL,
+                json={**_embedding_request(texts), "encoding_format": "base64"}
+            )
+            vectors = _decode_embeddings(texts, response)
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            logger.warning(f"Raw embeddings request failed, retrying via SDK: {e}")
+
+        if vectors is None:
+            response = self.openai_client.embeddings.create(**_embedding_request(texts))
+            vectors = _response_vectors(texts, response.data)
+        return vectors
+
+    def _embed_queries(self, queries: List[str]) -> np.ndarray:
+        """Generate embeddings for several queries in a single OpenAI request.
+
+        Args:
+            queries: The search query texts
+
+        Returns:
+            float32 array of shape (len(queries), dims), rows in the same order as ``queries``
+        """
+        if not queries:
+            return np.empty((0, 0), dtype=np.float32)
+
+        normalized = [_normalize_query(query) for query in queries]
+        embeddings, misses = _cached_embeddings(normalized)
+
+        if misses:
+            _store_embeddings(self._create_embeddings(misses), embeddings)
 
-        logger.info(f"Connected to Qdrant Cloud collection: {COLLECTION_NAME}")
+        return np.stack([embeddings[text] for text in normalized])
 
-    def _embed_query(self, query: str) -> List[float]:
+    def _embed_query(self, query: str) -> np.ndarray:
         """Generate embedding for a query using OpenAI.
 
         Args:
             query: The search query text
 
         Returns:
-            List of floats representing the embedding vector
+            1-D float32 array holding the embedding vector
+        """
+        return self._embed_queries([query])[0]
+
+    def _query_points_batch(
+        self,
+        query_vectors: np.ndarray,
+        record_type: str,
+        limit: int,
+        offset: int = 0
+    ) -> List[List[Any]]:
+        """Run one type-filtered vector query per row in a single query_batch_points request.
+
+        Args:
+            query_vectors: float32 array of query embeddings, one per row
+            record_type: Payload type to search ("vehicle_to_battery" or "battery_to_vehicle")
+            limit: Maximum number of points per query
+            offset: Number of top hits to skip (for paging)
+
+        Returns:
+            One list of scored points per query vector, in input order
         """
-        response = self.openai_client.embeddings.create(
-            model=EMBEDDING_MODEL,
-            input=query
+        type_filter = _TYPE_FILTERS[record_type]
+        responses = self.qdrant_client.query_batch_points(
+            collection_name=COLLECTION_NAME,
+            requests=[
+                QueryRequest(
+                    query=query_vector,
+                    filter=type_filter,
+                    limit=limit,
+                    offset=offset,
+                    params=_SEARCH_PARAMS,
+                    with_payload=True
+                )
+                for query_vector in query_vectors
+            ]
         )
-        return response.data[0].embedding
+        return [response.points for response in responses]
+
+    def warmup(self, seed_queries: Optional[List[str]] = None) -> int:
+        """Pre-embed common queries so the first matching tool call hits the cache.
+
+        Embeds all seed queries in a single OpenAI request, which also opens the
+        pooled HTTP connection.
+
+        Args:
+            seed_queries: Queries to embed (defaults to the CSR_WARMUP_QUERIES_PATH file)
+
+        Returns:
+            Number of queries embedded, 0 if there were none or the request failed
+        """
+        if seed_queries is None:
+            seed_queries = _load_warmup_queries(_WARMUP_QUERIES_PATH)
+        if not seed_queries:
+            logger.info("No warmup queries configured")
+            return 0
+
+        try:
+            self._embed_queries(seed_queries)
+        except Exception as e:
+            logger.warning(f"Embedding warmup failed: {e}")
+            return 0
+
+        logger.info(f"Warmed embedding cache with {len(seed_queries)} queries")
+        return len(seed_queries)
 
     def _extract_search_terms(self, query: str) -> Dict[str, Any]:
         """Extract and normalize search terms from a vehicle query.
@@ -107,62 +609,19 @@ class QdrantFitmentsRetriever:
             - 'year': Extracted year (4-digit) or None
             - 'make': Potential make name or None
             - 'model_terms': List of model-related terms (normalized)
+            - 'model_terms_set': Same terms as a frozenset, for exact token matching
             - 'all_terms': All normalized terms for matching
             - 'original_query': Original query string
         """
-        import re
-
-        # Normalize query: lowercase, strip whitespace
-        normalized = query.lower().strip()
-
-        # Extract 4-digit year if present (1900-2099)
-        year_match = re.search(r'\b(19\d{2}|20\d{2})\b', normalized)
-        year = year_match.group(1) if year_match else None
-
-        # Remove year from query for further processing
-        query_without_year = re.sub(r'\b(19\d{2}|20\d{2})\b', '', normalized).strip()
-
-        # Known vehicle types to filter out (not useful for matching)
-        vehicle_types = {'motorcycle', 'atv', 'scooter', 'snowmobile', 'utv',
-                         'pwc', 'jet ski', 'side-by-side', 'dirt bike', 'bike'}
-
-        # Tokenize and filter - split on spaces, hyphens, slashes, commas
-        tokens = re.split(r'[\s\-/,]+', query_without_year)
-        tokens = [t for t in tokens if t and len(t) > 0]
-
-        # Filter out vehicle types
-        significant_tokens = [t for t in tokens if t not in vehicle_types]
-
-        # Known makes for identification (common powersports manufacturers)
-        known_makes = {
-            'honda', 'yamaha', 'kawasaki', 'suzuki', 'bmw', 'ducati', 'ktm',
-            'harley', 'triumph', 'aprilia', 'indian', 'victory', 'moto guzzi',
-            'arctic cat', 'polaris', 'can-am', 'sea-doo', 'ski-doo', 'bombardier',
-            'aeon', 'benzai', 'kymco', 'sym', 'piaggio', 'vespa', 'peugeot',
-            'husqvarna', 'beta', 'gas gas', 'sherco', 'tm', 'royal enfield',
-            'cfmoto', 'linhai', 'hisun', 'massimo', 'argo', 'textron'
-        }
-
-        # Check if first token is a known make
-        make = None
-        model_terms = significant_tokens.copy()
-        if significant_tokens:
-            first_token = significant_tokens[0]
-            if first_token in known_makes:
-                make = first_token
-                model_terms = significant_tokens[1:]  # Remaining tokens are model
-            # Handle compound makes like "Arctic Cat" or "Can-Am"
-            elif len(significant_tokens) >= 2:
-                compound = f"{significant_tokens[0]} {significant_tokens[1]}"
-                if compound in known_makes:
-                    make = compound
-                    model_terms = significant_tokens[2:]
+        year, make, model_terms, model_terms_set, all_terms = _parse_search_terms(query)
 
+        # Fresh dict and lists per call so callers can't mutate the cached parse
         return {
             'year': year,
             'make': make,
-            'model_terms': model_terms,
-            'all_terms': significant_tokens,
+            'model_terms': list(model_terms),
+            'model_terms_set': model_terms_set,
+            'all_terms': list(all_terms),
             'original_query': query
         }
 
@@ -202,20 +661,22 @@ class QdrantFitmentsRetriever:
         # 1. Model term matching (CRITICAL - highest weight: 0.6)
         model_terms = search_terms.get('model_terms', [])
         if model_terms:
-            model_matches = 0
-            for term in model_terms:
-                # For numeric terms (like "100"), require exact token match
-                # This prevents "100" from matching "gl1000" as a substring
-                is_numeric = term.isdigit()
-
-                if is_numeric:
-                    # Numeric terms: only exact token match
-                    if term in result_model_tokens:
-                        model_matches += 1
-                else:
-                    # Non-numeric terms: check exact token match first
-                    if term in result_model_tokens:
+            # Exact token matches for all terms in one set intersection
+            model_terms_set = search_terms.get('model_terms_set') or frozenset(model_terms)
+            exact_hits = model_terms_set & result_model_tokens
+
+            if len(exact_hits) == len(model_terms):
+                # Every term matched a token exactly (common case): no per-term checks
+                model_matches = len(model_terms)
+            else:
+                model_matches = 0
+                for term in model_terms:
+                    if term in exact_hits:
                         model_matches += 1
+                    # For numeric terms (like "100"), require exact token match
+                    # This prevents "100" from matching "gl1000" as a substring
+                    elif term.isdigit():
+                        continue
                     # Then check substring match in model (e.g., "sport" in "cx sport")
                     elif term in result_model_normalized:
                         model_matches += 1
@@ -226,8 +687,16 @@ class QdrantFitmentsRetriever:
             model_score = min(model_matches / len(model_terms), 1.0)
             score += model_score * 0.6
 
-        # 2. Make matching (weight: 0.25)
         query_make = search_terms.get('make')
+        query_year = search_terms.get('year')
+
+        # With model terms the fallback below never applies, so make + year are the only
+        # remaining contributions; skip them when even both cannot reach the threshold.
+        # (No early exit once the threshold is reached: callers rank by the full score.)
+        if model_terms and score + (0.25 if query_make else 0.0) + (0.15 if query_year else 0.0) < 0.3:
+            return (False, score)
+
+        # 2. Make matching (weight: 0.25)
         if query_make:
             if query_make in result_make or result_make in query_make:
                 score += 0.25
@@ -236,7 +705,6 @@ class QdrantFitmentsRetriever:
                 score += 0.15
 
         # 3. Year matching (weight: 0.15)
-        query_year = search_terms.get('year')
         if query_year:
             if query_year == result_year:
                 score += 0.15
@@ -266,9 +734,10 @@ class QdrantFitmentsRetriever:
     ) -> List[Dict[str, Any]]:
         """Fallback to Supabase keyword search when semantic search fails.
 
-        Uses ILIKE queries on the model field to find vehicles that match
-        the search terms. This handles cases where semantic similarity fails
-        (e.g., "CX-Sport 100" not finding "Cobra/CX-Sport 100").
+        Uses a full-text prefix match on the model field, falling back to
+        ILIKE queries, to find vehicles that match the search terms. This
+        handles cases where semantic similarity fails (e.g., "CX-Sport 100"
+        not finding "Cobra/CX-Sport 100").
 
         Args:
             search_terms: Extracted terms from _extract_search_terms()
@@ -292,31 +761,49 @@ class QdrantFitmentsRetriever:
             if not search_list:
                 return []
 
-            # Start with base query
-            query = self.supabase.table('chrome_fitments').select(
-                'id, vehicle_type, make, model, year, cc, chrome_model, chrome_sku, yuasa_model'
-            )
-
-            # Build ILIKE conditions for each term
             # Numeric tokens (e.g. "570", "1000") represent engine displacement (cc)
             # and must be searched against the 'cc' column, not 'model'
-            for term in search_list:
-                if len(term) >= 2:  # Skip very short terms
-                    if term.isdigit():
-                        query = query.ilike('cc', f'%{term}%')
-                    else:
-                        query = query.ilike('model', f'%{term}%')
+            model_words = [term for term in search_list if len(term) >= 2 and not term.isdigit()]
+            cc_terms = [term for term in search_list if len(term) >= 2 and term.isdigit()]
+
+            def base_query():
+                query = self.supabase.table('chrome_fitments').select(
+                    'id, vehicle_type, make, model, year, cc, chrome_model, chrome_sku, yuasa_model'
+                )
+                for term in cc_terms:
+                    query = query.ilike('cc', f'%{term}%')
 
-            # Add make filter if specified
-            if query_make:
-                query = query.ilike('make', f'%{query_make}%')
+                # Add make filter if specified
+                if query_make:
+                    query = query.ilike('make', f'%{query_make}%')
 
-            # Add year filter if specified
-            if query_year:
-                query = query.eq('year', query_year)
+                # Add year filter if specified
+                if query_year:
+                    query = query.eq('year', query_year)
+                return query
 
-            # Execute with limit
-            result = query.limit(top_k * 3).execute()
+            result = None
+
+            # Prefer one full-text match on model (uses the GIN index on
+            # to_tsvector('simple', model)); all words must match as prefixes
+            tsquery = " & ".join(
+                f"{word}:*" for word in (_TSQUERY_UNSAFE_RE.sub('', w) for w in model_words) if word
+            )
+            if tsquery and SUPABASE_FITMENTS_FTS:
+                try:
+                    result = base_query().limit(top_k * 3).text_search(
+                        'model', tsquery, options={"config": "simple"}
+                    ).execute()
+                except Exception as e:
+                    logger.warning(f"Supabase full-text fallback failed, using ILIKE: {e}")
+
+            # ILIKE substring match per word, which also finds infix matches
+            # (e.g. "sport" in "Cobra/CX-Sport 100") that prefix search misses
+            if not result or not result.data:
+                query = base_query()
+                for term in model_words:
+                    query = query.ilike('model', f'%{term}%')
+                result = query.limit(top_k * 3).execute()
 
             if not result.data:
                 return []
@@ -352,6 +839,166 @@ class QdrantFitmentsRetriever:
             logger.error(f"Supabase fallback search error: {e}")
             return []
 
+    @staticmethod
+    def _rank_vehicle_results(
+        validated_results: List[Dict[str, Any]],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Sort validated vehicle → battery results by combined score, limited to top_k."""
+        # Sort by combined score (highest first)
+        validated_results.sort(key=lambda x: x["score"], reverse=True)
+
+        # Limit to requested top_k
+        return validated_results[:top_k]
+
+    def _validate_points(
+        self,
+        points: List[Any],
+        search_terms: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Validate Qdrant points for a vehicle → battery query and score the matches.
+
+        Args:
+            points: Scored points returned by Qdrant
+            search_terms: Extracted terms from _extract_search_terms()
+
+        Returns:
+            Validated results (unsorted) with combined "score" and "match_score"
+        """
+        # Fitments repeat the same vehicle once per compatible battery, so each distinct
+        # (make, model, year) is scored once per batch and only matches build a result
+        match_cache: Dict[Tuple[Any, Any, Any], Tuple[bool, float]] = {}
+        validated_results = []
+        for point in points:
+            payload = point.payload or {}
+            vehicle = (payload.get("make", ""), payload.get("model", ""), payload.get("year", ""))
+
+            # Validate the result matches the query
+            match = match_cache.get(vehicle)
+            if match is None:
+                match = match_cache[vehicle] = self._validate_vehicle_match(
+                    {"make": vehicle[0], "model": vehicle[1], "year": vehicle[2]},
+                    search_terms
+                )
+            is_valid, match_score = match
+            if not is_valid:
+                continue
+
+            validated_results.append({
+                "id": point.id,
+                "document": payload.get("document", ""),
+                "chrome_model": payload.get("chrome_model", ""),
+                "chrome_sku": payload.get("chrome_sku", ""),
+                "make": vehicle[0],
+                "model": vehicle[1],
+                "year": vehicle[2],
+                "yuasa_model": payload.get("yuasa_model", ""),
+                "semantic_score": point.score,
+                # Combine semantic score with validation score
+                # Weighted: 40% semantic + 60% validation
+                "score": (point.score * 0.4) + (match_score * 0.6),
+                "match_score": match_score
+            })
+
+        return validated_results
+
+    @staticmethod
+    def _ranking_settled(
+        validated_results: List[Dict[str, Any]],
+        page_points: List[Any],
+        page_limit: int,
+        top_k: int
+    ) -> bool:
+        """Whether fetching further candidates can no longer change the top_k.
+
+        Qdrant returns hits in descending similarity, so any later candidate scores at
+        most 0.4 * (last similarity seen) + 0.6 * 1.0. Once the top_k-th combined score
+        reaches that bound (or the collection has no more hits), the ranking is final.
+        """
+        if len(page_points) < page_limit:
+            return True
+        if len(validated_results) < top_k:
+            return False
+        kth_score = sorted((r["score"] for r in validated_results), reverse=True)[top_k - 1]
+        return kth_score >= page_points[-1].score * 0.4 + 0.6
+
+    def search_batteries_for_vehicles(
+        self,
+        queries: List[str],
+        top_k: int = 5
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for batteries that fit several vehicles at once.
+
+        Embeds all queries in a single OpenAI request and runs all Qdrant
+        searches in a single query_batch_points request, then validates each
+        query's results the same way as search_battery_for_vehicle.
+
+        Args:
+            queries: Natural language queries describing vehicles
+            top_k: Maximum number of results to return per query
+
+        Returns:
+            One list of matching fitments per query, in input order
+        """
+        if not queries:
+            return []
+
+        try:
+            query_vectors = self._embed_queries(queries)
+        except Exception as e:
+            logger.error(f"Error embedding vehicle queries: {e}")
+            return [[] for _ in queries]
+
+        # Search Qdrant with filter for vehicle_to_battery type, one round trip per page for
+        # all unsettled queries. Up to max(50, top_k * 10) hits are considered so correct
+        # matches aren't missed during validation filtering (semantic search may rank the
+        # correct match lower), but paging stops once a query's top_k can no longer change.
+        all_search_terms = [self._extract_search_terms(query) for query in queries]
+        all_validated: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        pending = list(range(len(queries)))
+        try:
+            for offset, limit in _candidate_pages(top_k):
+                pages = self._query_points_batch(
+                    query_vectors[pending],
+                    "vehicle_to_battery",
+                    limit=limit,
+                    offset=offset
+                )
+                still_pending = []
+                for i, points in zip(pending, pages):
+                    all_validated[i].extend(self._validate_points(points, all_search_terms[i]))
+                    if not self._ranking_settled(all_validated[i], points, limit, top_k):
+                        still_pending.append(i)
+                pending = still_pending
+                if not pending:
+                    break
+        except Exception as e:
+            logger.error(f"Error searching batteries for vehicles: {e}")
+            return [[] for _ in queries]
+
+        all_results = []
+        for query, search_terms, validated_results in zip(queries, all_search_terms, all_validated):
+            try:
+                validated_results = self._rank_vehicle_results(validated_results, top_k)
+
+                # If no validated results, try Supabase fallback (keyword search)
+                # This handles cases where semantic search fails to find the vehicle
+                # (e.g., "CX-Sport 100" not semantically similar to "Cobra/CX-Sport 100")
+                if not validated_results:
+                    logger.info(f"Semantic search returned no validated results, trying Supabase fallback...")
+                    validated_results = self._supabase_fallback_search(search_terms, top_k)
+
+                logger.info(
+                    f"Found {len(validated_results)} validated battery matches for query: {query[:50]}..."
+                )
+                all_results.append(validated_results)
+
+            except Exception as e:
+                logger.error(f"Error searching batteries for vehicle: {e}")
+                all_results.append([])
+
+        return all_results
+
     def search_battery_for_vehicle(
         self,
         query: str,
@@ -375,79 +1022,228 @@ class QdrantFitmentsRetriever:
             - make, model, year: Vehicle details
             - score: Combined similarity and validation score (higher = better match)
         """
-        try:
-            # Extract search terms for validation
-            search_terms = self._extract_search_terms(query)
+        return self.search_batteries_for_vehicles([query], top_k)[0]
 
-            # Generate query embedding
-            query_vector = self._embed_query(query)
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _battery_model_variants(battery_model: str) -> tuple:
+        """Normalize a battery model to the formats stored in the collection.
 
-            # Search Qdrant with filter for vehicle_to_battery type
-            # Request significantly more results to ensure correct matches aren't missed
-            # during validation filtering (semantic search may rank correct match lower)
-            results = self.qdrant_client.query_points(
-                collection_name=COLLECTION_NAME,
-                query=query_vector,
-                query_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="type",
-                            match=MatchValue(value="vehicle_to_battery")
-                        )
-                    ]
-                ),
-                limit=max(50, top_k * 10),  # Get many results to find correct matches
-                with_payload=True
-            )
+        Users may search "YTZ7S" but DB stores "YTZ7S-BS". Memoized, like the
+        variant set and exact-match filter below, since popular models repeat.
+
+        Args:
+            battery_model: Battery model name as entered by the user
+
+        Returns:
+            Tuple of (model_without_bs, model_with_bs)
+        """
+        normalized = battery_model.upper().strip()
+
+        # Generate both variants: with and without -BS suffix
+        if normalized.endswith("-BS"):
+            model_with_bs = normalized
+            model_without_bs = normalized.removesuffix("-BS")
+        else:
+            model_without_bs = normalized.translate(_DASH_TABLE)  # Also handle "YTZ-7S" -> "YTZ7S"
+            model_with_bs = f"{model_without_bs}-BS"
+
+        return model_without_bs, model_with_bs
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _model_search_variants(model_without_bs: str, model_with_bs: str) -> frozenset:
+        """Spellings of a battery model that count as an exact chrome_model match."""
+        return frozenset({
+            model_without_bs,
+            model_with_bs,
+            model_without_bs.translate(_DASH_TABLE),  # Handle any remaining dashes
+        })
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _exact_model_filter(model_without_bs: str, model_with_bs: str) -> Filter:
+        """Payload filter for battery_to_vehicle records whose chrome_model is any search variant."""
+        variants = QdrantFitmentsRetriever._model_search_variants(model_without_bs, model_with_bs)
+        return Filter(
+            must=[
+                _BATTERY_TYPE_CONDITION,
+                FieldCondition(
+                    key="chrome_model",
+                    match=MatchAny(any=sorted(variants))
+                )
+            ]
+        )
+
+    @staticmethod
+    def _battery_query_text(model_without_bs: str, model_with_bs: str) -> str:
+        """Query text with both model variants for better semantic matching."""
+        return f"{model_without_bs} {model_with_bs} battery fits vehicles compatible"
+
+    @staticmethod
+    def _vehicle_result(point: Any, score: float) -> Dict[str, Any]:
+        """Convert a battery_to_vehicle point into a result dict.
+
+        Args:
+            point: Qdrant point (scored or scrolled)
+            score: Score to report for the result
+
+        Returns:
+            Vehicle result with make, model, year and battery metadata
+        """
+        payload = point.payload or {}
+        return {
+            "id": point.id,
+            "document": payload.get("document", ""),
+            "make": payload.get("make", ""),
+            "model": payload.get("model", ""),
+            "year": payload.get("year", ""),
+            "chrome_model": payload.get("chrome_model", ""),
+            "chrome_sku": payload.get("chrome_sku", ""),
+            "score": score
+        }
+
+    @staticmethod
+    def _vehicle_key(point: Any) -> Tuple[Any, Any, Any]:
+        """(make, model, year) of a battery_to_vehicle point, for deduplicating vehicles."""
+        payload = point.payload or {}
+        return payload.get("make", ""), payload.get("model", ""), payload.get("year", "")
+
+    @staticmethod
+    def _unique_vehicle_results(points: List[Any]) -> List[Dict[str, Any]]:
+        """Convert exact-match points to results, keeping the first point per vehicle."""
+        results = []
+        seen = set()
+        for point in points:
+            vehicle_key = QdrantFitmentsRetriever._vehicle_key(point)
+            if vehicle_key not in seen:
+                seen.add(vehicle_key)
+                # Exact metadata matches have no similarity score
+                results.append(QdrantFitmentsRetriever._vehicle_result(point, 1.0))
+        return results
+
+    @staticmethod
+    def _match_battery_points(
+        points: List[Any],
+        model_without_bs: str,
+        model_with_bs: str,
+        top_k: int,
+        partial: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Keep points whose chrome_model matches the requested battery model.
+
+        Args:
+            points: Scored points returned by Qdrant
+            model_without_bs: Normalized model without the -BS suffix
+            model_with_bs: Normalized model with the -BS suffix
+            top_k: Maximum number of results to return
+            partial: Also accept substring matches (e.g. "YTX14" vs "YTX14H")
 
-            # Format and validate results
-            validated_results = []
-            for point in results.points:
-                payload = point.payload or {}
-                result_dict = {
-                    "id": point.id,
-                    "document": payload.get("document", ""),
-                    "chrome_model": payload.get("chrome_model", ""),
-                    "chrome_sku": payload.get("chrome_sku", ""),
-                    "make": payload.get("make", ""),
-                    "model": payload.get("model", ""),
-                    "year": payload.get("year", ""),
-                    "yuasa_model": payload.get("yuasa_model", ""),
-                    "semantic_score": point.score
-                }
-
-                # Validate the result matches the query
-                is_valid, match_score = self._validate_vehicle_match(result_dict, search_terms)
-
-                if is_valid:
-                    # Combine semantic score with validation score
-                    # Weighted: 40% semantic + 60% validation
-                    result_dict["score"] = (point.score * 0.4) + (match_score * 0.6)
-                    result_dict["match_score"] = match_score
-                    validated_results.append(result_dict)
-
-            # Sort by combined score (highest first)
-            validated_results.sort(key=lambda x: x["score"], reverse=True)
-
-            # Limit to requested top_k
-            validated_results = validated_results[:top_k]
-
-            # If no validated results, try Supabase fallback (keyword search)
-            # This handles cases where semantic search fails to find the vehicle
-            # (e.g., "CX-Sport 100" not semantically similar to "Cobra/CX-Sport 100")
-            if not validated_results:
-                logger.info(f"Semantic search returned no validated results, trying Supabase fallback...")
-                validated_results = self._supabase_fallback_search(search_terms, top_k)
-
-            logger.info(
-                f"Found {len(validated_results)} validated battery matches for query: {query[:50]}..."
+        Returns:
+            Matching vehicles, limited to top_k
+        """
+        # Match against both normalized forms for flexibility
+        formatted = []
+        search_variants = QdrantFitmentsRetriever._model_search_variants(model_without_bs, model_with_bs)
+        # The same fitment can be indexed more than once; keep one per vehicle
+        seen = set()
+
+        for point in points:
+            vehicle_key = QdrantFitmentsRetriever._vehicle_key(point)
+            if vehicle_key in seen:
+                continue
+
+            # Normalize stored model for comparison (uppercase once, reuse for both forms)
+            stored_with_bs = (point.payload or {}).get("chrome_model", "").upper()
+            stored_normalized = _norm_model(stored_with_bs)
+
+            # Exact match is a set probe; substring checks only when asked for
+            is_match = (
+                stored_normalized in search_variants or
+                stored_with_bs in search_variants
             )
-            return validated_results
+            if not is_match and partial:
+                is_match = (
+                    model_without_bs in stored_normalized or
+                    stored_normalized in model_without_bs
+                )
 
-        except Exception as e:
-            logger.error(f"Error searching batteries for vehicle: {e}")
+            if is_match:
+                seen.add(vehicle_key)
+                formatted.append(QdrantFitmentsRetriever._vehicle_result(point, point.score))
+
+                # Stop once we have enough results
+                if len(formatted) >= top_k:
+                    break
+
+        return formatted
+
+    def search_vehicles_for_batteries(
+        self,
+        battery_models: List[str],
+        top_k: int = 20
+    ) -> List[List[Dict[str, Any]]]:
+        """Search for vehicles compatible with several battery models at once.
+
+        First tries an exact chrome_model match with a metadata-only scroll, which
+        needs no embedding. Only models with no exact hits are embedded (in one
+        OpenAI request) and searched semantically (in one query_batch_points
+        request) with Python-side model matching.
+
+        Args:
+            battery_models: Battery model names (e.g., ["YTZ7S", "YTX14-BS"])
+            top_k: Maximum number of results to return per model
+
+        Returns:
+            One list of matching vehicles per battery model, in input order
+        """
+        if not battery_models:
             return []
 
+        variants = [self._battery_model_variants(model) for model in battery_models]
+
+        # Stage 1: exact chrome_model match via a metadata-only scroll (no embedding,
+        # no vector search; needs a keyword payload index on chrome_model for best performance)
+        all_results: List[List[Dict[str, Any]]] = [[] for _ in battery_models]
+        for i, (model_without_bs, model_with_bs) in enumerate(variants):
+            try:
+                points, _ = self.qdrant_client.scroll(
+                    collection_name=COLLECTION_NAME,
+                    scroll_filter=self._exact_model_filter(model_without_bs, model_with_bs),
+                    limit=top_k,
+                    with_payload=True
+                )
+                # The same fitment can be indexed more than once; keep one per vehicle
+                all_results[i] = self._unique_vehicle_results(points)
+            except Exception as e:
+                logger.warning(f"Exact chrome_model scroll failed, using semantic fallback: {e}")
+
+        # Stage 2: semantic search with Python-side matching for models without exact hits
+        pending = [i for i, results in enumerate(all_results) if not results]
+        if pending:
+            try:
+                # Build query text with both variants for better semantic matching
+                query_vectors = self._embed_queries([
+                    self._battery_query_text(*variants[i]) for i in pending
+                ])
+
+                # Search Qdrant with filter for battery_to_vehicle type
+                # Get more results than needed to account for filtering
+                all_points = self._query_points_batch(
+                    query_vectors,
+                    "battery_to_vehicle",
+                    limit=top_k * 5  # Get more results to filter from
+                )
+                for i, points in zip(pending, all_points):
+                    all_results[i] = self._match_battery_points(points, *variants[i], top_k)
+            except Exception as e:
+                logger.error(f"Error searching vehicles for batteries: {e}")
+
+        for battery_model, formatted in zip(battery_models, all_results):
+            logger.info(f"Found {len(formatted)} vehicle matches for battery: {battery_model}")
+
+        return all_results
+
     def search_vehicles_for_battery(
         self,
         battery_model: str,
@@ -469,88 +1265,31 @@ class QdrantFitmentsRetriever:
             - document: Full description text
             - score: Similarity score (higher = better match)
         """
-        try:
-            # Normalize battery model to expected DB formats
-            # Users may search "YTZ7S" but DB stores "YTZ7S-BS"
-            normalized = battery_model.upper().strip()
-
-            # Generate both variants: with and without -BS suffix
-            if normalized.endswith("-BS"):
-                model_with_bs = normalized
-                model_without_bs = normalized.replace("-BS", "")
-            else:
-                model_without_bs = normalized.replace("-", "")  # Also handle "YTZ-7S" -> "YTZ7S"
-                model_with_bs = f"{model_without_bs}-BS"
-
-            # Build query text with both variants for better semantic matching
-            query = f"{model_without_bs} {model_with_bs} battery fits vehicles compatible"
-            query_vector = self._embed_query(query)
-
-            # Search Qdrant with filter for battery_to_vehicle type
-            # Get more results than needed to account for filtering
-            results = self.qdrant_client.query_points(
-                collection_name=COLLECTION_NAME,
-                query=query_vector,
-                query_filter=Filter(
-                    must=[
-                        FieldCondition(
-                            key="type",
-                            match=MatchValue(value="battery_to_vehicle")
-                        )
-                    ]
-                ),
-                limit=top_k * 5,  # Get more results to filter from
-                with_payload=True
-            )
-
-            # Format results, filtering for battery model match
-            # Match against both normalized forms for flexibility
-            formatted = []
-            search_variants = {
-                model_without_bs,
-                model_with_bs,
-                model_without_bs.replace("-", ""),  # Handle any remaining dashes
-            }
+        return self.search_vehicles_for_batteries([battery_model], top_k)[0]
 
-            for point in results.points:
-                payload = point.payload or {}
-                chrome_model = payload.get("chrome_model", "").upper()
+    def enable_quantization(self) -> bool:
+        """Enable int8 scalar quantization on the collection (one-off admin operation).
 
-                # Normalize stored model for comparison
-                stored_normalized = chrome_model.replace("-BS", "").replace("-", "")
-                stored_with_bs = chrome_model
+        Quantized vectors are kept in RAM (4x smaller than float32) while the originals
+        stay available for the rescoring requested by _SEARCH_PARAMS.
 
-                # Match if any variant matches
-                is_match = (
-                    stored_normalized in search_variants or
-                    stored_with_bs in search_variants or
-                    model_without_bs == stored_normalized or
-                    model_without_bs in stored_normalized or
-                    stored_normalized in model_without_bs
+        Returns:
+            True if Qdrant accepted the update
+        """
+        try:
+            return self.qdrant_client.update_collection(
+                collection_name=COLLECTION_NAME,
+                quantization_config=ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8,
+                        quantile=0.99,
+                        always_ram=True
+                    )
                 )
-
-                if is_match:
-                    formatted.append({
-                        "id": point.id,
-                        "document": payload.get("document", ""),
-                        "make": payload.get("make", ""),
-                        "model": payload.get("model", ""),
-                        "year": payload.get("year", ""),
-                        "chrome_model": payload.get("chrome_model", ""),
-                        "chrome_sku": payload.get("chrome_sku", ""),
-                        "score": point.score
-                    })
-
-                    # Stop once we have enough results
-                    if len(formatted) >= top_k:
-                        break
-
-            logger.info(f"Found {len(formatted)} vehicle matches for battery: {battery_model}")
-            return formatted
-
+            )
         except Exception as e:
-            logger.error(f"Error searching vehicles for battery: {e}")
-            return []
+            logger.error(f"Error enabling quantization: {e}")
+            return False
 
     def get_collection_stats(self) -> Dict[str, Any]:
         """Get collection statistics for debugging.
@@ -563,8 +1302,52 @@ class QdrantFitmentsRetriever:
             return {
                 "collection_name": COLLECTION_NAME,
                 "document_count": info.points_count,
-                "vector_size": info.config.params.vectors.size if info.config.params.vectors else None
+                "vector_size": info.config.params.vectors.size if info.config.params.vectors else None,
+                "quantization": info.config.quantization_config is not None
             }
         except Exception as e:
             logger.error(f"Error getting collection stats: {e}")
             return {"error": str(e)}
+
+
+# Shared retriever instance so clients and their connection pools are reused across tool calls
+_RETRIEVER: Optional[QdrantFitmentsRetriever] = None
+_RETRIEVER_LOCK = threading.Lock()
+
+
+def get_retriever() -> QdrantFitmentsRetriever:
+    """Return the process-wide QdrantFitmentsRetriever, creating it on first use.
+
+    Returns:
+        Shared retriever instance
+
+    Raises:
+        ValueError: If required credentials are missing (nothing is cached, so
+            the next call retries)
+    """
+    global _RETRIEVER
+    if _RETRIEVER is None:
+        with _RETRIEVER_LOCK:
+            if _RETRIEVER is None:
+                _RETRIEVER = QdrantFitmentsRetriever()
+    return _RETRIEVER
+
+
+def start_warmup() -> threading.Thread:
+    """Build the shared retriever and warm its embedding cache in a background thread.
+
+    Runs off the caller's thread so graph construction is not delayed by network
+    calls. Failures (e.g. missing credentials) are logged and otherwise ignored.
+
+    Returns:
+        The started daemon thread
+    """
+    def _run() -> None:
+        try:
+            get_retriever().warmup()
+        except Exception as e:
+            logger.warning(f"Fitments retriever warmup skipped: {e}")
+
+    thread = threading.Thread(target=_run, name="fitments-warmup", daemon=True)
+    thread.start()
+    return thread
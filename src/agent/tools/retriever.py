@@ -1,8 +1,11 @@
 """Pinecone retriever for RAG-based knowledge queries using modern Pinecone SDK."""
 
 import os
+import threading
 import time
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
+import httpx
 from langchain_core.documents import Document
 from langchain_openai import OpenAIEmbeddings
 from pinecone import Pinecone
@@ -10,6 +13,47 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Pinecone's gRPC transport sends query vectors as protobuf instead of JSON, avoiding
+# the stdlib json encode/decode of 1536 floats per call. Needs the optional
+# pinecone[grpc] extra, so it is opt-in
+PINECONE_PREFER_GRPC = os.getenv("PINECONE_PREFER_GRPC", "").lower() in ("1", "true", "yes")
+try:
+    from pinecone.grpc import PineconeGRPC
+    PINECONE_GRPC_AVAILABLE = True
+except ImportError:
+    PINECONE_GRPC_AVAILABLE = False
+
+# Process-wide LRU cache of query embeddings keyed by (model, normalized query)
+_EMBEDDING_CACHE_SIZE = 1024
+_embedding_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+# HTTP/2 needs the optional h2 package; fall back to pooled HTTP/1.1 keep-alive without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One keep-alive connection pool to the OpenAI API shared by every PineconeRetriever, so
+# embedding calls after the first skip the TCP + TLS handshake
+_openai_http_client: Optional[httpx.Client] = None
+_openai_http_client_lock = threading.Lock()
+
+
+def _shared_openai_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client for OpenAI embedding requests."""
+    global _openai_http_client
+    if _openai_http_client is None:
+        with _openai_http_client_lock:
+            if _openai_http_client is None:
+                _openai_http_client = httpx.Client(
+                    http2=HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=40, max_keepalive_connections=20),
+                    timeout=httpx.Timeout(10.0, connect=5.0)
+                )
+    return _openai_http_client
+
 
 class PineconeRetriever:
     """Pinecone-based retriever for customer service knowledge base using modern Pinecone SDK."""
@@ -31,14 +75,67 @@ class PineconeRetriever:
         if not api_key:
             raise ValueError("PINECONE_API_KEY not found in environment")
 
-        # Initialize modern Pinecone client
-        self.pc = Pinecone(api_key=api_key)
+        # Clients are created on first use so constructing the retriever is cheap
+        self._api_key = api_key
+        self.embedding_model = embedding_model
+        self._pc: Optional[Pinecone] = None
+        self._index = None
+        self._embeddings: Optional[OpenAIEmbeddings] = None
+
+    @property
+    def pc(self) -> Pinecone:
+        """Pinecone client (gRPC transport when PINECONE_PREFER_GRPC is set and available)."""
+        if self._pc is None:
+            if PINECONE_PREFER_GRPC and PINECONE_GRPC_AVAILABLE:
+                self._pc = PineconeGRPC(api_key=self._api_key)
+            else:
+                if PINECONE_PREFER_GRPC:
+                    logger.warning("PINECONE_PREFER_GRPC set but pinecone[grpc] is not installed; using REST")
+                self._pc = Pinecone(api_key=self._api_key)
+        return self._pc
+
+    @property
+    def index(self):
+        """Pinecone index handle."""
+        if self._index is None:
+            self._index = self.pc.Index(self.index_name)
+        return self._index
+
+    @property
+    def embeddings(self) -> OpenAIEmbeddings:
+        """OpenAI embeddings client (only needed on query-embedding cache misses)."""
+        if self._embeddings is None:
+            self._embeddings = OpenAIEmbeddings(
+                model=self.embedding_model,
+                http_client=_shared_openai_http_client()
+            )
+        return self._embeddings
+
+    def _embed_query(self, query: str) -> List[float]:
+        """
+        Embed a query, reusing the cached vector for repeated query text.
 
-        # Get index
-        self.index = self.pc.Index(self.index_name)
+        Args:
+            query: Search query
 
-        # Initialize embeddings
-        self.embeddings = OpenAIEmbeddings(model=embedding_model)
+        Returns:
+            Embedding vector
+        """
+        key = (self.embedding_model, " ".join(query.split()))
+        with _embedding_cache_lock:
+            cached = _embedding_cache.get(key)
+            if cached is not None:
+                _embedding_cache.move_to_end(key)
+                return list(cached)
+
+        embedding = self.embeddings.embed_query(query)
+
+        # Stored as a tuple so callers can't mutate the cached vector
+        with _embedding_cache_lock:
+            _embedding_cache[key] = tuple(embedding)
+            while len(_embedding_cache) > _EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
+        return embedding
 
     def retrieve(
         self,
@@ -64,7 +161,7 @@ class PineconeRetriever:
             k = top_k or self.top_k
 
             # Embed the query
-            query_embedding = self.embeddings.embed_query(query)
+            query_embedding = self._embed_query(query)
 
             # Query Pinecone directly
             results = self.index.query(
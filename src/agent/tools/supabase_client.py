@@ -4,25 +4,195 @@ This module provides a lightweight Supabase client for querying order and shipme
 from the shipworks_order and shipworks_shipment tables.
 """
 
+import atexit
 import os
 import logging
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 from functools import lru_cache
 
+import httpx
+from dotenv import load_dotenv
+
 try:
     from supabase import create_client, Client
+    from supabase.lib.client_options import SyncClientOptions
+    from postgrest.exceptions import APIError
     SUPABASE_AVAILABLE = True
+    # Older supabase-py releases can't take an injected httpx client
+    SUPABASE_HTTPX_OPTION = "httpx_client" in SyncClientOptions.__dataclass_fields__
 except ImportError:
     SUPABASE_AVAILABLE = False
+    SUPABASE_HTTPX_OPTION = False
+    APIError = Exception
     Client = None
+    SyncClientOptions = None
+
+# Load environment variables
+load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Credentials are read once at import and validated when a client is first needed
+_SUPABASE_URL = os.getenv("SUPABASE_URL")
+_SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
+
+# Connection pool for PostgREST calls: keep-alive connections are reused across tool
+# calls instead of paying a TCP + TLS handshake per query, and the cap keeps bursts
+# from queueing on Supabase's connection limit
+SUPABASE_MAX_CONNECTIONS = int(os.getenv("SUPABASE_MAX_CONNECTIONS", "60"))
+SUPABASE_KEEPALIVE = int(os.getenv("SUPABASE_KEEPALIVE", "40"))
+SUPABASE_KEEPALIVE_EXPIRY = float(os.getenv("SUPABASE_KEEPALIVE_EXPIRY", "60"))
+SUPABASE_POOL_TIMEOUT = float(os.getenv("SUPABASE_POOL_TIMEOUT", "10"))
+
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=SUPABASE_MAX_CONNECTIONS,
+    max_keepalive_connections=SUPABASE_KEEPALIVE,
+    keepalive_expiry=SUPABASE_KEEPALIVE_EXPIRY
+)
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0, pool=SUPABASE_POOL_TIMEOUT)
+_HTTP_RETRIES = 3  # Connection-level retries (failed connects only, never sent requests)
+
+
+def _sync_client_options() -> Optional[SyncClientOptions]:
+    """Sync client options with a pooled HTTP client (None if it can't be injected)."""
+    if not SUPABASE_HTTPX_OPTION:
+        return None
+    return SyncClientOptions(httpx_client=httpx.Client(
+        limits=_HTTP_LIMITS,
+        timeout=_HTTP_TIMEOUT,
+        transport=httpx.HTTPTransport(retries=_HTTP_RETRIES, limits=_HTTP_LIMITS)
+    ))
+
+
+def _injected_http_client(client: Any) -> Any:
+    """Return the pooled HTTP client injected into a Supabase client, if any."""
+    options = getattr(client, "options", None)
+    return getattr(options, "httpx_client", None)
+
+
+# Sync client singleton: reads skip the lock once the client exists
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+_ORDER_ITEM_FIELDS = "OrderItemID, OrderID, Name, SKU, Quantity, UnitPrice, Description, Weight"
+
+# Columns the order tools actually read. shipworks_order is wide, so selecting these
+# instead of "*" cuts what Postgres serializes and the client has to parse
+ORDER_FIELDS = (
+    "OrderID, OrderNumber, OrderNumberComplete, OrderDate, OrderTotal, OnlineStatus, "
+    "RollupItemCount, BillFirstName, BillLastName, BillEmail, "
+    "ShipFirstName, ShipLastName, ShipCity, ShipStateProvCode, ShipCountryCode"
+)
+
+# Columns the RMA tools read (format_rma_status plus order/email for listings)
+RMA_FIELDS = (
+    "RmaNumber, ItemName, ReturnType, ReturnStatus, Approved, RmaDate, ReturnTracking, "
+    "ReturnLabelSent, ReturnReceived, ReturnAction, Results, OrderNumber, Email"
+)
+
+# Max OrderIDs per in_() filter; PostgREST puts the list in the URL
+ORDER_ID_BATCH_SIZE = 500
+
+# Short-lived cache of read query results: agents re-fetch the same order several times
+# within a conversation, and a repeat inside the TTL skips the PostgREST round trip
+SUPABASE_CACHE_SIZE = int(os.getenv("SUPABASE_CACHE_SIZE", "1024"))
+SUPABASE_CACHE_TTL = float(os.getenv("SUPABASE_CACHE_TTL", "60"))
+
+# Email lookups go through SQL functions comparing lower(email) = lower($1), which an
+# expression index turns into a B-tree lookup instead of the sequential scan ILIKE
+# needs (and, unlike ILIKE, treats "_" and "%" in addresses literally). Migration:
+#
+#   CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_shipworks_order_lower_bill_email
+#       ON shipworks_order ((lower("BillEmail")));
+#   CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_chromeinventory_rma_lower_email
+#       ON chromeinventory_rma ((lower("Email")));
+#   CREATE OR REPLACE FUNCTION orders_by_lower_email(email text)
+#       RETURNS SETOF shipworks_order LANGUAGE sql STABLE
+#       AS $$ SELECT * FROM shipworks_order WHERE lower("BillEmail") = lower(email) $$;
+#   CREATE OR REPLACE FUNCTION rma_by_lower_email(email text)
+#       RETURNS SETOF chromeinventory_rma LANGUAGE sql STABLE
+#       AS $$ SELECT * FROM chromeinventory_rma WHERE lower("Email") = lower(email) $$;
+#
+# Opt in with SUPABASE_EMAIL_RPC=1 once it is deployed; if the functions turn out to be
+# missing, lookups fall back to ILIKE for the rest of the process.
+SUPABASE_EMAIL_RPC = os.getenv("SUPABASE_EMAIL_RPC", "0").lower() in ("1", "true", "yes")
+_EMAIL_RPCS = {
+    ("shipworks_order", "BillEmail"): "orders_by_lower_email",
+    ("chromeinventory_rma", "Email"): "rma_by_lower_email",
+}
+_email_rpc_unavailable = False
+
+# PostgREST error codes for schema objects that haven't been deployed yet
+_PGRST_NO_RELATIONSHIP = "PGRST200"
+_PGRST_NO_FUNCTION = "PGRST202"
+
+
+def _is_pgrst_error(error: Exception, code: str) -> bool:
+    return getattr(error, "code", None) == code
+
+
+class _QueryCache:
+    """Thread-safe LRU cache of query rows with a per-entry TTL.
+
+    Rows are copied on the way in and out, so callers can't mutate cached results.
+    """
+
+    def __init__(self, capacity: int, ttl: float):
+        self._capacity = capacity
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[list]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self._ttl:
+                self._entries.pop(key, None)
+                logger.debug("Supabase cache miss: %s", key)
+                return None
+            self._entries.move_to_end(key)
+            logger.debug("Supabase cache hit: %s", key)
+            return [dict(row) for row in entry[1]]
+
+    def put(self, key: Hashable, rows: list) -> list:
+        """Store rows and return them (the caller keeps the original objects)."""
+        if self._capacity > 0 and self._ttl > 0:
+            with self._lock:
+                self._entries[key] = (time.monotonic(), [dict(row) for row in rows])
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._capacity:
+                    self._entries.popitem(last=False)
+        return rows
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        with self._lock:
+            if table is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == table]:
+                    del self._entries[key]
+
+
+_query_cache = _QueryCache(SUPABASE_CACHE_SIZE, SUPABASE_CACHE_TTL)
+
+
+def invalidate_query_cache(table: Optional[str] = None) -> None:
+    """Drop cached query results for one table (or all tables), e.g. after a write.
+
+    Args:
+        table: Table name such as "shipworks_order", or None for every table
+    """
+    _query_cache.invalidate(table)
+
 
 class SupabaseConnection:
     """Supabase connection manager for order data queries.
 
-    Creates a Supabase client using credentials from environment variables.
+    Borrows the shared pooled client from get_supabase_client(), so entering a
+    `with` block costs no new client, connection pool or TLS handshake.
 
     Usage:
         with SupabaseConnection() as supabase:
@@ -30,65 +200,32 @@ class SupabaseConnection:
     """
 
     def __init__(self):
-        self.url = os.getenv("SUPABASE_URL")
-        self.key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
-
-        if not self.url:
-            raise ValueError(
-                "SUPABASE_URL environment variable must be set. "
-                "Please add it to your .env file."
-            )
-
-        if not self.key:
-            raise ValueError(
-                "SUPABASE_SERVICE_ROLE_KEY (or SUPABASE_KEY) environment variable must be set. "
-                "Please add it to your .env file."
-            )
-
-        if not SUPABASE_AVAILABLE:
-            raise ImportError(
-                "supabase-py library is not installed. "
-                "Please install it: pip install supabase"
-            )
-
+        self.url, self.key = _validate_env()
         self.client: Optional[Client] = None
 
     def __enter__(self) -> Client:
-        """Create and return Supabase client."""
-        logger.info(f"🔌 Connecting to Supabase at {self.url}")
-
-        try:
-            self.client = create_client(self.url, self.key)
-            logger.info("✅ Supabase connection established")
-            return self.client
-        except Exception as e:
-            logger.error(f"❌ Failed to connect to Supabase: {e}")
-            raise
+        """Return the shared Supabase client."""
+        self.client = get_supabase_client()
+        return self.client
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Clean up Supabase client (no explicit cleanup needed for HTTP client)."""
+        """Release the shared client; its connection pool stays open for reuse."""
         if exc_type:
-            logger.error(f"⚠️ Error during Supabase operation: {exc_val}")
-        logger.info("✅ Supabase connection closed")
+            logger.error("⚠️ Error during Supabase operation: %s", exc_val)
         self.client = None
 
 
-@lru_cache(maxsize=1)
-def get_supabase_client() -> Client:
-    """Get a cached Supabase client instance.
-
-    This function creates and caches a single Supabase client for reuse across tool calls.
-    The client is thread-safe and can be shared across multiple requests.
+def _validate_env() -> Tuple[str, str]:
+    """Validate the Supabase URL and key read from the environment at import.
 
     Returns:
-        Client: Supabase client instance
+        Tuple of (url, key)
 
     Raises:
         ValueError: If environment variables are not set
         ImportError: If supabase-py library is not installed
     """
-    url = os.getenv("SUPABASE_URL")
-    key = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("SUPABASE_KEY")
+    url, key = _SUPABASE_URL, _SUPABASE_KEY
 
     if not url:
         raise ValueError(
@@ -108,40 +245,184 @@ def get_supabase_client() -> Client:
             "Please install it: pip install supabase"
         )
 
-    logger.info(f"🔌 Creating Supabase client for {url}")
-    client = create_client(url, key)
-    logger.info("✅ Supabase client created")
+    return url, key
+
+
+def get_supabase_client() -> Client:
+    """Get a cached Supabase client instance.
+
+    This function creates and caches a single Supabase client for reuse across tool calls.
+    The client is thread-safe and can be shared across multiple requests.
+
+    Returns:
+        Client: Supabase client instance
+
+    Raises:
+        ValueError: If environment variables are not set
+        ImportError: If supabase-py library is not installed
+    """
+    global _client
+    if _client is not None:
+        return _client
+
+    with _client_lock:
+        if _client is None:
+            url, key = _validate_env()
+
+            logger.info("🔌 Creating Supabase client for %s", url)
+            client = create_client(url, key, options=_sync_client_options())
+            http_client = _injected_http_client(client)
+            if http_client is not None:
+                atexit.register(http_client.close)
+            logger.info("✅ Supabase client created")
+            _client = client
+
+    return _client
+
+
+def _as_str(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+# Emails repeat across a conversation's tool calls, so their normalized forms are memoized
+
+@lru_cache(maxsize=256)
+def _strip_email(email_value: str) -> str:
+    return email_value.strip()
+
+
+@lru_cache(maxsize=256)
+def _fold_email(email_value: str) -> str:
+    return email_value.strip().lower()
+
+
+# Query builders for the query helpers below
+
+def _orders_query(client: Any, filter_field: str, filter_value: str, select_fields: str) -> Any:
+    if select_fields.strip() == "*":
+        logger.warning("⚠️ Selecting every shipworks_order column; pass ORDER_FIELDS or an explicit list")
+    return (
+        client.table("shipworks_order")
+        .select(select_fields)
+        .eq(filter_field, _as_str(filter_value))  # Explicit string cast for type safety
+    )
+
+
+def _shipments_query(client: Any, order_id: int) -> Any:
+    return (
+        client.table("shipworks_shipment")
+        .select("*")
+        .eq("OrderID", order_id)
+        .eq("Voided", False)
+        .order("ShipDate", desc=True)
+    )
+
+
+def _order_items_query(client: Any, order_id: int) -> Any:
+    return (
+        client.table("shipworks_order_item")
+        .select(_ORDER_ITEM_FIELDS)
+        .eq("OrderID", order_id)
+        .order("OrderItemID")
+    )
+
+
+def _email_query(
+    client: Any,
+    table_name: str,
+    email_field: str,
+    email_value: str,
+    select_fields: str,
+    order_by: Optional[str],
+    order_desc: bool,
+    limit: Optional[int] = None,
+    rpc: Optional[str] = None
+) -> Any:
+    # Build query with case-insensitive email matching
+    if rpc:
+        query = client.rpc(rpc, {"email": _fold_email(email_value)}).select(select_fields)
+    else:
+        query = (
+            client.table(table_name)
+            .select(select_fields)
+            .ilike(email_field, _strip_email(email_value))  # ILIKE is case-insensitive
+        )
+
+    # Add ordering if specified
+    if order_by:
+        query = query.order(order_by, desc=order_desc)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
 
-    return client
+
+def _email_rpc(table_name: str, email_field: str) -> Optional[str]:
+    """Indexed lookup function for a table's email field, if enabled and available."""
+    if not SUPABASE_EMAIL_RPC or _email_rpc_unavailable:
+        return None
+    return _EMAIL_RPCS.get((table_name, email_field))
+
+
+def _disable_email_rpc(rpc: str, error: Exception) -> None:
+    global _email_rpc_unavailable
+    logger.warning("⚠️ %s() unavailable, using slower ILIKE email lookups: %s", rpc, error)
+    _email_rpc_unavailable = True
+
+
+def _execute_email_query(build: Callable[[Optional[str]], Any], table_name: str, email_field: str) -> Any:
+    """Execute build(rpc) via the indexed function, falling back to ILIKE (build(None))."""
+    rpc = _email_rpc(table_name, email_field)
+    if rpc is None:
+        return build(None).execute()
+    try:
+        return build(rpc).execute()
+    except APIError as e:
+        if not _is_pgrst_error(e, _PGRST_NO_FUNCTION):
+            raise
+        _disable_email_rpc(rpc, e)
+        return build(None).execute()
+
+
+def _email_cache_key(
+    table_name: str,
+    email_field: str,
+    email_value: str,
+    select_fields: str,
+    order_by: Optional[str],
+    order_desc: bool,
+    limit: Optional[int] = None
+) -> tuple:
+    # ILIKE matching is case-insensitive, so differently-cased emails share an entry
+    return (table_name, email_field, _fold_email(email_value), select_fields, order_by, order_desc, limit)
 
 
 # Convenience function for simple queries without context manager
 def query_orders_table(
     filter_field: str,
     filter_value: str,
-    select_fields: str = "*"
+    select_fields: str = ORDER_FIELDS
 ) -> list:
     """Query the shipworks_order table with a single filter.
 
     Args:
         filter_field: Field name to filter on (e.g., "OrderNumberComplete", "BillEmail")
         filter_value: Value to match
-        select_fields: Fields to select (default: "*")
+        select_fields: Fields to select (default: ORDER_FIELDS)
 
     Returns:
         List of matching order records
     """
     try:
+        key = ("shipworks_order", filter_field, _as_str(filter_value), select_fields)
+        rows = _query_cache.get(key)
+        if rows is not None:
+            return rows
+
         client = get_supabase_client()
-        response = (
-            client.table("shipworks_order")
-            .select(select_fields)
-            .eq(filter_field, str(filter_value))  # Explicit string cast for type safety
-            .execute()
-        )
-        return response.data
+        response = _orders_query(client, filter_field, filter_value, select_fields).execute()
+        return _query_cache.put(key, response.data)
     except Exception as e:
-        logger.error(f"❌ Error querying orders table: {e}")
+        logger.error("❌ Error querying orders table: %s", e)
         raise
 
 
@@ -155,18 +436,16 @@ def query_shipments_by_order_id(order_id: int) -> list:
         List of matching shipment records
     """
     try:
+        key = ("shipworks_shipment", "OrderID", order_id)
+        rows = _query_cache.get(key)
+        if rows is not None:
+            return rows
+
         client = get_supabase_client()
-        response = (
-            client.table("shipworks_shipment")
-            .select("*")
-            .eq("OrderID", order_id)
-            .eq("Voided", False)
-            .order("ShipDate", desc=True)
-            .execute()
-        )
-        return response.data
+        response = _shipments_query(client, order_id).execute()
+        return _query_cache.put(key, response.data)
     except Exception as e:
-        logger.error(f"❌ Error querying shipments table: {e}")
+        logger.error("❌ Error querying shipments table: %s", e)
         raise
 
 
@@ -180,27 +459,141 @@ def query_order_items_by_order_id(order_id: int) -> list:
         List of matching order item records with product details
     """
     try:
+        key = ("shipworks_order_item", "OrderID", order_id)
+        rows = _query_cache.get(key)
+        if rows is not None:
+            return rows
+
         client = get_supabase_client()
-        response = (
-            client.table("shipworks_order_item")
-            .select("OrderItemID, OrderID, Name, SKU, Quantity, UnitPrice, Description, Weight")
-            .eq("OrderID", order_id)
-            .order("OrderItemID")
-            .execute()
+        response = _order_items_query(client, order_id).execute()
+        return _query_cache.put(key, response.data)
+    except Exception as e:
+        logger.error("❌ Error querying order items table: %s", e)
+        raise
+
+
+def _query_by_order_ids(
+    table_name: str,
+    order_ids: List[int],
+    build: Callable[[Any, List[int]], Any]
+) -> Dict[int, list]:
+    """Run build(client, ids) for uncached order IDs in chunks and group rows by OrderID."""
+    rows_by_order: Dict[int, list] = {}
+    missing = []
+    for order_id in dict.fromkeys(order_ids):
+        rows = _query_cache.get((table_name, "OrderID", order_id))
+        if rows is None:
+            missing.append(order_id)
+        else:
+            rows_by_order[order_id] = rows
+
+    if missing:
+        client = get_supabase_client()
+        for start in range(0, len(missing), ORDER_ID_BATCH_SIZE):
+            chunk = missing[start:start + ORDER_ID_BATCH_SIZE]
+            response = build(client, chunk).execute()
+
+            fetched: Dict[int, list] = {order_id: [] for order_id in chunk}
+            for row in response.data:
+                fetched.setdefault(row.get("OrderID"), []).append(row)
+            for order_id, rows in fetched.items():
+                rows_by_order[order_id] = _query_cache.put((table_name, "OrderID", order_id), rows)
+
+    return rows_by_order
+
+
+def query_order_items_by_order_ids(order_ids: List[int]) -> Dict[int, list]:
+    """Query the items of several orders in one round trip.
+
+    Args:
+        order_ids: OrderIDs to look up items for
+
+    Returns:
+        Mapping of each OrderID to its item records (empty list if it has none)
+    """
+    try:
+        return _query_by_order_ids(
+            "shipworks_order_item",
+            order_ids,
+            lambda client, ids: (
+                client.table("shipworks_order_item")
+                .select(_ORDER_ITEM_FIELDS)
+                .in_("OrderID", ids)
+                .order("OrderItemID")
+            )
         )
-        return response.data
     except Exception as e:
-        logger.error(f"❌ Error querying order items table: {e}")
+        logger.error("❌ Error querying order items table: %s", e)
         raise
 
 
+# Set once PostgREST reports no relationship for the embedded select (no FK declared)
+_order_embedding_unavailable = False
+
+
+def query_order_with_items(
+    filter_field: str,
+    filter_value: str
+) -> List[Dict[str, Any]]:
+    """Query orders together with their items in one round trip.
+
+    Uses PostgREST resource embedding, which needs a foreign key from the items table:
+
+        ALTER TABLE shipworks_order_item
+            ADD CONSTRAINT shipworks_order_item_order_fk
+            FOREIGN KEY ("OrderID") REFERENCES shipworks_order ("OrderID") NOT VALID;
+        NOTIFY pgrst, 'reload schema';
+
+    Without it, falls back to an orders query plus an items query (same results).
+    Embedded items also populate the cache used by query_order_items_by_order_id.
+
+    Args:
+        filter_field: Order field to filter on (e.g., "OrderNumberComplete")
+        filter_value: Value to match
+
+    Returns:
+        List of order records, each with an "items" list
+    """
+    global _order_embedding_unavailable
+    if not _order_embedding_unavailable:
+        try:
+            client = get_supabase_client()
+            response = (
+                client.table("shipworks_order")
+                .select(f"{ORDER_FIELDS}, shipworks_order_item({_ORDER_ITEM_FIELDS})")
+                .eq(filter_field, _as_str(filter_value))
+                .order("OrderItemID", foreign_table="shipworks_order_item")
+                .execute()
+            )
+        except APIError as e:
+            if not _is_pgrst_error(e, _PGRST_NO_RELATIONSHIP):
+                logger.error("❌ Error querying orders with items: %s", e)
+                raise
+            logger.warning("⚠️ Embedded order items unavailable, using per-table queries: %s", e)
+            _order_embedding_unavailable = True
+        else:
+            results = []
+            for order in response.data:
+                items = order.pop("shipworks_order_item", None) or []
+                _query_cache.put(("shipworks_order_item", "OrderID", order.get("OrderID")), items)
+                results.append({**order, "items": items})
+            return results
+
+    results = []
+    for order in query_orders_table(filter_field, filter_value):
+        order_id = order.get("OrderID")
+        results.append({**order, "items": query_order_items_by_order_id(order_id) if order_id else []})
+    return results
+
+
 def query_table_by_email(
     table_name: str,
     email_field: str,
     email_value: str,
     select_fields: str = "*",
     order_by: Optional[str] = None,
-    order_desc: bool = True
+    order_desc: bool = True,
+    limit: Optional[int] = None
 ) -> list:
     """Query any table by email with case-insensitive matching.
 
@@ -215,6 +608,7 @@ def query_table_by_email(
         select_fields: Fields to select (default: "*")
         order_by: Optional field to order results by
         order_desc: Whether to sort descending (default: True)
+        limit: Maximum number of records to return (default: no limit)
 
     Returns:
         List of matching records
@@ -227,37 +621,41 @@ def query_table_by_email(
         rmas = query_table_by_email("chromeinventory_rma", "Email", "user@email.com", order_by="RmaDate")
     """
     try:
-        client = get_supabase_client()
+        key = _email_cache_key(table_name, email_field, email_value, select_fields, order_by, order_desc, limit)
+        rows = _query_cache.get(key)
+        if rows is not None:
+            return rows
 
-        # Build query with case-insensitive email matching
-        query = (
-            client.table(table_name)
-            .select(select_fields)
-            .ilike(email_field, email_value.strip())  # ILIKE is case-insensitive
+        client = get_supabase_client()
+        response = _execute_email_query(
+            lambda rpc: _email_query(
+                client, table_name, email_field, email_value, select_fields, order_by, order_desc, limit, rpc
+            ),
+            table_name,
+            email_field
         )
 
-        # Add ordering if specified
-        if order_by:
-            query = query.order(order_by, desc=order_desc)
-
-        response = query.execute()
-
-        logger.info(f"✅ Found {len(response.data)} records in {table_name} for email: {email_value}")
-        return response.data
+        logger.debug("✅ Found %d records in %s for email: %s", len(response.data), table_name, email_value)
+        return _query_cache.put(key, response.data)
 
     except Exception as e:
-        logger.error(f"❌ Error querying {table_name} by email: {e}")
+        logger.error("❌ Error querying %s by email: %s", table_name, e)
         raise
 
 
-def query_orders_by_email(email: str, select_fields: str = "*") -> list:
-    """Query orders by email with case-insensitive matching.
+def query_orders_by_email(
+    email: str,
+    select_fields: str = ORDER_FIELDS,
+    limit: Optional[int] = None
+) -> list:
+    """Query orders by email with case-insensitive matching, newest first.
 
     Convenience function that wraps query_table_by_email for the shipworks_order table.
 
     Args:
         email: Email address to search for (case-insensitive)
-        select_fields: Fields to select (default: "*")
+        select_fields: Fields to select (default: ORDER_FIELDS)
+        limit: Maximum number of orders to return, newest first (default: no limit)
 
     Returns:
         List of matching order records
@@ -271,18 +669,88 @@ def query_orders_by_email(email: str, select_fields: str = "*") -> list:
         email_value=email,
         select_fields=select_fields,
         order_by="OrderDate",
-        order_desc=True
+        order_desc=True,
+        limit=limit
     )
 
 
-def query_rma_by_email(email: str, select_fields: str = "*") -> list:
+def _rma_number_key(rma_number: Any, select_fields: str) -> Tuple:
+    """Cache key of the single-row RmaNumber lookup that get_rma_status issues."""
+    return ("chromeinventory_rma", "RmaNumber", _as_str(rma_number).strip(), select_fields, 1)
+
+
+def _seed_rma_number_cache(rows: list, select_fields: str) -> list:
+    """Cache each RMA row under its RmaNumber lookup too, and return rows.
+
+    RMA tools are typically called in sequence (order or email listing, then one RMA's
+    details), so the detail lookup is answered from the listing instead of a new query.
+    RMA numbers that span several rows are left to the lookup itself, since the listing
+    can't tell which of them that query would return.
+    """
+    rows_by_number: Dict[str, list] = {}
+    for row in rows:
+        rma_number = row.get("RmaNumber")
+        if rma_number:
+            rows_by_number.setdefault(rma_number, []).append(row)
+    for rma_number, number_rows in rows_by_number.items():
+        if len(number_rows) == 1:
+            _query_cache.put(_rma_number_key(rma_number, select_fields), number_rows)
+    return rows
+
+
+def query_rma_records(
+    filter_field: str,
+    filter_value: str,
+    select_fields: str = RMA_FIELDS,
+    limit: Optional[int] = None
+) -> list:
+    """Query the chromeinventory_rma table with a single filter, newest first.
+
+    Args:
+        filter_field: Field name to filter on (e.g., "OrderNumber", "RmaNumber")
+        filter_value: Value to match
+        select_fields: Fields to select (default: RMA_FIELDS)
+        limit: Maximum number of records to return (default: no limit)
+
+    Returns:
+        List of matching RMA records
+    """
+    try:
+        filter_value = _as_str(filter_value).strip()
+        key = ("chromeinventory_rma", filter_field, filter_value, select_fields, limit)
+        rows = _query_cache.get(key)
+        if rows is not None:
+            return rows
+
+        client = get_supabase_client()
+        query = (
+            client.table("chromeinventory_rma")
+            .select(select_fields)
+            .eq(filter_field, filter_value)
+            .order("RmaDate", desc=True)
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        response = query.execute()
+        return _seed_rma_number_cache(_query_cache.put(key, response.data), select_fields)
+    except Exception as e:
+        logger.error("❌ Error querying RMA table: %s", e)
+        raise
+
+
+def query_rma_by_email(
+    email: str,
+    select_fields: str = RMA_FIELDS,
+    limit: Optional[int] = None
+) -> list:
     """Query RMA records by email with case-insensitive matching.
 
     Convenience function that wraps query_table_by_email for the chromeinventory_rma table.
 
     Args:
         email: Email address to search for (case-insensitive)
-        select_fields: Fields to select (default: "*")
+        select_fields: Fields to select (default: RMA_FIELDS)
+        limit: Maximum number of records to return, newest first (default: no limit)
 
     Returns:
         List of matching RMA records
@@ -290,11 +758,82 @@ def query_rma_by_email(email: str, select_fields: str = "*") -> list:
     Example:
         rmas = query_rma_by_email("customer@email.com")
     """
-    return query_table_by_email(
+    rows = query_table_by_email(
         table_name="chromeinventory_rma",
         email_field="Email",
         email_value=email,
         select_fields=select_fields,
         order_by="RmaDate",
-        order_desc=True
+        order_desc=True,
+        limit=limit
     )
+    return _seed_rma_number_cache(rows, select_fields)
+
+
+# Opt in with SUPABASE_WARRANTY_BUNDLE_RPC=1 once get_order_warranty_bundle() is deployed;
+# set once PostgREST reports the function missing
+SUPABASE_WARRANTY_BUNDLE_RPC = os.getenv("SUPABASE_WARRANTY_BUNDLE_RPC", "0").lower() in ("1", "true", "yes")
+_order_warranty_bundle_unavailable = False
+
+
+def get_order_warranty_bundle(order_number: str) -> Optional[Dict[str, Any]]:
+    """Fetch an order, its items and its RMA records via one server-side function call.
+
+    Serves the combined warranty + returns flow, which otherwise needs an order query
+    and an RMA query per order number:
+
+        CREATE OR REPLACE FUNCTION get_order_warranty_bundle(p_order_number text) RETURNS jsonb
+        LANGUAGE sql STABLE AS $$
+            SELECT jsonb_build_object(
+                'order', to_jsonb(o),
+                'items', coalesce((SELECT jsonb_agg(i ORDER BY i."OrderItemID")
+                                   FROM shipworks_order_item i
+                                   WHERE i."OrderID" = o."OrderID"), '[]'::jsonb),
+                'rmas', coalesce((SELECT jsonb_agg(r ORDER BY r."RmaDate" DESC)
+                                  FROM (SELECT "RmaNumber", "ItemName", "ReturnType", "ReturnStatus",
+                                               "Approved", "RmaDate", "ReturnTracking", "ReturnLabelSent",
+                                               "ReturnReceived", "ReturnAction", "Results",
+                                               "OrderNumber", "Email"
+                                        FROM chromeinventory_rma
+                                        WHERE "OrderNumber" = p_order_number) r), '[]'::jsonb))
+            FROM (SELECT 1) AS one
+            LEFT JOIN LATERAL (SELECT * FROM shipworks_order
+                               WHERE "OrderNumberComplete" = p_order_number LIMIT 1) o ON true
+        $$;
+        NOTIFY pgrst, 'reload schema';
+
+    Items and RMA rows also populate the caches used by the single-table helpers.
+
+    Args:
+        order_number: The order number (OrderNumberComplete / RMA OrderNumber)
+
+    Returns:
+        {"order": {...} or None, "items": [...], "rmas": [...]} (RMA rows with RMA_FIELDS),
+        or None when the function is disabled, isn't deployed or fails - callers then
+        query the tables separately
+    """
+    global _order_warranty_bundle_unavailable
+    if not SUPABASE_WARRANTY_BUNDLE_RPC or _order_warranty_bundle_unavailable:
+        return None
+
+    order_number = _as_str(order_number).strip()
+    try:
+        client = get_supabase_client()
+        bundle = client.rpc("get_order_warranty_bundle", {"p_order_number": order_number}).execute().data
+    except APIError as e:
+        if _is_pgrst_error(e, _PGRST_NO_FUNCTION):
+            logger.warning("⚠️ get_order_warranty_bundle() unavailable, using separate queries: %s", e)
+            _order_warranty_bundle_unavailable = True
+        else:
+            logger.error("❌ get_order_warranty_bundle() failed for %s, using separate queries: %s", order_number, e)
+        return None
+
+    bundle = bundle or {}
+    order = bundle.get("order")
+    items = bundle.get("items") or []
+    rmas = bundle.get("rmas") or []
+    if order:
+        _query_cache.put(("shipworks_order_item", "OrderID", order.get("OrderID")), items)
+    _query_cache.put(("chromeinventory_rma", "OrderNumber", order_number, RMA_FIELDS, None), rmas)
+    _seed_rma_number_cache(rmas, RMA_FIELDS)
+    return {"order": order, "items": items, "rmas": rmas}
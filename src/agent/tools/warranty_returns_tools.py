@@ -12,11 +12,18 @@ Key Features:
 - Integration with order data for warranty verification
 """
 
+import calendar
 import logging
 import os
 import re
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, Dict, Any, Hashable, List, NamedTuple, Optional, Tuple
 from langchain_core.tools import tool
 
 # Load environment variables if not already loaded
@@ -24,73 +31,334 @@ from dotenv import load_dotenv
 load_dotenv()
 
 # Import Supabase client utilities (for RMA queries only)
-from src.agent.tools.supabase_client import get_supabase_client, query_rma_by_email
+from src.agent.tools.supabase_client import (
+    RMA_FIELDS,
+    get_order_warranty_bundle,
+    query_rma_by_email,
+    query_rma_records
+)
+
+# Shared order utilities - NO database duplication
+from src.agent.tools.order_utils import build_order_with_items, get_order_with_items
 
 logger = logging.getLogger(__name__)
 
+class BrandWarranty(NamedTuple):
+    """Warranty periods for one brand, plus its preformatted policy summary line."""
+    refund_days: int
+    replacement_days: int
+    name: str
+    policy_line: str
+
+
+def _brand_warranty(refund_days: int, replacement_days: int, name: str) -> BrandWarranty:
+    return BrandWarranty(
+        refund_days,
+        replacement_days,
+        name,
+        f"  • {name}: {refund_days}-day refund, {replacement_days}-day replacement"
+    )
+
+
 # Brand-Specific Warranty Configuration
 # Based on ChromeBattery warranty policy effective 2024-03-01
-# Format: {brand_prefix: {refund_days, replacement_days}}
+# Format: {brand_prefix: BrandWarranty(refund_days, replacement_days, name, policy_line)}
 BRAND_WARRANTY_CONFIG = {
-    "ZB": {
-        "refund_days": 30,
-        "replacement_days": 365,
-        "name": "Standard (ZB)"
-    },
-    "PB": {
-        "refund_days": 45,
-        "replacement_days": 365,
-        "name": "Performance (PB)"
-    },
-    "PRO": {
-        "refund_days": 75,
-        "replacement_days": 732,  # 2 years
-        "name": "Professional (PRO)"
-    },
-    "BT": {
-        "refund_days": 90,
-        "replacement_days": 732,  # 2 years
-        "name": "Bluetooth (BT)"
-    },
-    "default": {
-        "refund_days": 60,
-        "replacement_days": 549,  # ~1.5 years
-        "name": "Default"
-    }
+    "ZB": _brand_warranty(30, 365, "Standard (ZB)"),
+    "PB": _brand_warranty(45, 365, "Performance (PB)"),
+    "PRO": _brand_warranty(75, 732, "Professional (PRO)"),  # 2 years replacement
+    "BT": _brand_warranty(90, 732, "Bluetooth (BT)"),  # 2 years replacement
+    "default": _brand_warranty(60, 549, "Default"),  # ~1.5 years replacement
 }
 
+# Static policy text, built once from BRAND_WARRANTY_CONFIG instead of on every tool call
+_WARRANTY_POLICY_FOOTER = "\n".join(
+    ["📋 Warranty Policy by Brand:"] + [info.policy_line for info in BRAND_WARRANTY_CONFIG.values()]
+)
+
+_ALL_BRANDS_WARRANTY_INFO = "\n".join(
+    [
+        "🛡️ ChromeBattery Warranty Policies by Brand:",
+        "",
+        "Our warranty coverage varies by product line to ensure the best",
+        "protection for your specific battery type.",
+        ""
+    ]
+    + [
+        line
+        for info in BRAND_WARRANTY_CONFIG.values()
+        for line in (
+            f"📦 {info.name}:",
+            f"   • Refund Period: {info.refund_days} days from purchase",
+            f"   • Replacement Period: {info.replacement_days} days from purchase",
+            ""
+        )
+    ]
+    + [
+        "💡 Tips:",
+        "   • Refund period allows full money-back returns",
+        "   • Replacement period covers warranty exchanges",
+        "   • Brand is determined by product SKU (e.g., ZB-12R-35 is Standard)"
+    ]
+)
+
+
+def _format_external_order_policy(brand: str, info: BrandWarranty) -> str:
+    block = (
+        f"📋 {info.name} Warranty Policy:\n"
+        f"   • Refund Period: {info.refund_days} days from purchase\n"
+        f"   • Replacement Period: {info.replacement_days} days from purchase"
+    )
+    if brand == "default":
+        # Brand detection found nothing, so say why the default periods apply
+        block += (
+            "\n\n💡 Note: Could not detect specific brand from product info.\n"
+            "   Default warranty periods applied. If you have the product SKU,\n"
+            "   please provide it for more accurate warranty information."
+        )
+    return block
+
+
+# Policy section closing each check_warranty_from_order_data response, by brand code
+_EXTERNAL_ORDER_POLICY_BLOCKS = {
+    brand: _format_external_order_policy(brand, info) for brand, info in BRAND_WARRANTY_CONFIG.items()
+}
+
+
+def _format_brand_warranty_info(info: BrandWarranty) -> str:
+    return "\n".join([
+        f"🛡️ Warranty Policy for {info.name}:",
+        "",
+        f"📅 Refund Period: {info.refund_days} days from purchase date",
+        "   Full refund available for returns within this period",
+        "",
+        f"🔄 Replacement Period: {info.replacement_days} days from purchase date",
+        "   Warranty replacement available for defective items",
+        "",
+        "💡 Note:",
+        "   • Warranty period starts from the original purchase date",
+        "   • Refund period is shorter than replacement period",
+        "   • Items must meet return conditions (see our return policy)",
+    ])
+
+
+# Complete get_brand_warranty_info responses, keyed by upper-cased brand argument plus
+# the spellings callers usually pass as-is ("all", config keys) so those skip normalizing
+_BRAND_WARRANTY_INFO = {
+    "ALL": _ALL_BRANDS_WARRANTY_INFO,
+    **{brand.upper(): _format_brand_warranty_info(info) for brand, info in BRAND_WARRANTY_CONFIG.items()},
+}
+_BRAND_WARRANTY_INFO.update({
+    "all": _ALL_BRANDS_WARRANTY_INFO,
+    **{brand: _BRAND_WARRANTY_INFO[brand.upper()] for brand in BRAND_WARRANTY_CONFIG},
+})
+
+
+# Reply shared by the RMA listing tools when the lookup fails
+_RMA_LOOKUP_ERROR = "❌ An error occurred while looking up RMA records. Please try again or contact support."
+
+# Tool response caches. The warranty key includes today's date, but elapsed days are
+# counted from the order's time of day, so a cached answer can trail a day-count
+# rollover by up to WARRANTY_CACHE_TTL. RMA state can move at any time, so it expires sooner
+WARRANTY_CACHE_TTL = float(os.getenv("WARRANTY_CACHE_TTL", "3600"))
+RMA_STATUS_CACHE_TTL = float(os.getenv("RMA_STATUS_CACHE_TTL", "300"))
+
+
+class _ResponseCache:
+    """Thread-safe LRU cache of formatted tool responses with a per-entry TTL."""
+
+    def __init__(self, capacity: int, ttl: float):
+        self._capacity = capacity
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self._ttl:
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: Hashable, response: str) -> str:
+        if self._capacity > 0 and self._ttl > 0:
+            with self._lock:
+                self._entries[key] = (time.monotonic(), response)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._capacity:
+                    self._entries.popitem(last=False)
+        return response
+
+
+_warranty_cache = _ResponseCache(512, WARRANTY_CACHE_TTL)
+_rma_status_cache = _ResponseCache(512, RMA_STATUS_CACHE_TTL)
+
 # Helper Functions
 
+# Ordinal suffixes in screenshot dates ("January 15th, 2024")
+_ORDINAL_SUFFIX = re.compile(r'(\d+)(?:st|nd|rd|th)\b')
+_ORDINAL_SUFFIXES = ("st", "nd", "rd", "th")
+
+# Dates embedded in longer text - common patterns in Amazon order screenshots
+_EMBEDDED_DATE_RE = re.compile(
+    r'\d{1,2}/\d{1,2}/\d{4}'           # 01/15/2024
+    r'|\d{4}-\d{2}-\d{2}'              # 2024-01-15
+    r'|[A-Za-z]+ \d{1,2}, \d{4}'        # January 15, 2024 / Jan 15, 2024
+)
+
+# Month names and abbreviations, matched case-insensitively like strptime's %B / %b
+_MONTHS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names)
+    if name
+}
+
+
+def _build_date(year: str, month: int, day: str) -> Optional[datetime]:
+    """Build a datetime from %Y (four digits) and %d (one or two digits) fields, else None."""
+    digits = year + day
+    if len(year) != 4 or not 0 < len(day) <= 2 or not (digits.isdigit() and digits.isascii()):
+        return None
+    try:
+        return datetime(int(year), month, int(day))
+    except ValueError:
+        return None
+
+
+def _numeric_date_parser(separator: str, order: str) -> Callable[[str], Optional[datetime]]:
+    """Build a parser for separator-delimited numeric dates; order names the fields ("mdy")."""
+    year_at, month_at, day_at = (order.index(field) for field in "ymd")
+
+    def parse(value: str) -> Optional[datetime]:
+        parts = value.split(separator)
+        if len(parts) != 3:
+            return None
+        month = parts[month_at]
+        if not 0 < len(month) <= 2 or not (month.isdigit() and month.isascii()):
+            return None
+        return _build_date(parts[year_at], int(month), parts[day_at])
+
+    return parse
+
+
+def _strptime_parser(fmt: str) -> Callable[[str], Optional[datetime]]:
+    def parse(value: str) -> Optional[datetime]:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            return None
+
+    return parse
+
+
+def _parse_month_name_date(value: str) -> Optional[datetime]:
+    """Parse "January 15, 2024", "Jan 15 2024" or "15 January 2024"."""
+    parts = value.split()
+    if len(parts) != 3:
+        return None
+    first, second, year = parts
+    month = _MONTHS.get(first.lower())
+    if month is not None:
+        day = second[:-1] if second.endswith(",") else second
+    else:
+        month = _MONTHS.get(second.lower())
+        if month is None:
+            return None
+        day = first
+    return _build_date(year, month, day)
+
+
+_parse_us_date = _numeric_date_parser("/", "mdy")           # 01/15/2024, 1/15/2024
+_parse_dashed_ymd_date = _numeric_date_parser("-", "ymd")   # 2024-01-15
+_parse_dashed_datetime = _strptime_parser("%Y-%m-%d %H:%M:%S")  # 2024-01-15 10:30:00
+
+# Fallback parsers for strings that aren't ISO 8601, grouped by the date separator so a
+# string is only tried against layouts that could match it. Each accepts what the
+# matching strptime format would (including unpadded fields) without its regex machinery
+_DATE_PARSERS_BY_SEPARATOR = {
+    "/": (
+        _parse_us_date,
+        _numeric_date_parser("/", "dmy"),   # 15/01/2024 (European format)
+    ),
+    "-": (
+        _parse_dashed_ymd_date,
+        _parse_dashed_datetime,
+        _numeric_date_parser("-", "mdy"),   # 01-15-2024
+    ),
+    "": (
+        _parse_month_name_date,
+    ),
+}
+_DISPLAY_DATE_PARSERS_BY_SEPARATOR = {
+    "/": (_parse_us_date,),
+    "-": (_parse_dashed_ymd_date, _parse_dashed_datetime),
+    "": (),
+}
+
+
+def _date_separator(value: str) -> str:
+    return "/" if "/" in value else "-" if "-" in value else ""
+
+
+def _parse_with(parsers: Tuple[Callable[[str], Optional[datetime]], ...], value: str) -> Optional[datetime]:
+    for parse in parsers:
+        dt = parse(value)
+        if dt is not None:
+            return dt
+    return None
+
+
+def _is_iso_date(value: str) -> bool:
+    """Cheap shape check for YYYY-MM-DD prefixed strings (what Supabase returns)."""
+    return len(value) >= 10 and value[4] == '-' and value[7] == '-'
+
+
+def _fromisoformat(value: str) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
 def format_date(date_value: Any) -> str:
     """Format a date value from database to readable string."""
     if not date_value:
         return "Not available"
 
     try:
-        if isinstance(date_value, str):
-            # Handle various date formats
-            # Try ISO format first
-            try:
-                dt = datetime.fromisoformat(date_value.replace('Z', '+00:00'))
-                return dt.strftime("%B %d, %Y")
-            except:
-                # Try other common formats
-                for fmt in ["%Y-%m-%d", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S"]:
-                    try:
-                        dt = datetime.strptime(date_value, fmt)
-                        return dt.strftime("%B %d, %Y")
-                    except:
-                        continue
-                return date_value
-        elif isinstance(date_value, datetime):
-            return date_value.strftime("%B %d, %Y")
+        if isinstance(date_value, datetime):
+            return _format_day_cached(date_value.toordinal())
+        elif isinstance(date_value, str):
+            return _format_date_str_cached(date_value)
         else:
             return str(date_value)
     except Exception as e:
-        logger.warning(f"Error formatting date {date_value}: {e}")
+        logger.warning("Error formatting date %s: %s", date_value, e)
         return str(date_value)
 
 
+@lru_cache(maxsize=2048)
+def _format_day_cached(ordinal: int) -> str:
+    # Parsed order dates repeat across items and calls; skip the locale-aware strftime
+    return datetime.fromordinal(ordinal).strftime("%B %d, %Y")
+
+
+@lru_cache(maxsize=2048)
+def _format_date_str_cached(date_value: str) -> str:
+    # The same order and RMA dates are formatted for every item and repeated tool call
+    # ISO format first (the common case)
+    dt = _fromisoformat(date_value)
+    if dt is not None:
+        return dt.strftime("%B %d, %Y")
+
+    # Try other common formats
+    dt = _parse_with(_DISPLAY_DATE_PARSERS_BY_SEPARATOR[_date_separator(date_value)], date_value)
+    return dt.strftime("%B %d, %Y") if dt is not None else date_value
+
+
 def parse_date(date_value: Any) -> Optional[datetime]:
     """Parse a date value to datetime object (timezone-naive for calculations).
 
@@ -111,44 +379,32 @@ def parse_date(date_value: Any) -> Optional[datetime]:
                 return date_value.replace(tzinfo=None)
             return date_value
         elif isinstance(date_value, str):
-            # Clean up the string - remove ordinal suffixes (1st, 2nd, 3rd, 4th, etc.)
-            clean_value = re.sub(r'(\d+)(st|nd|rd|th)', r'\1', date_value.strip())
-
-            # Try ISO format first
-            try:
-                dt = datetime.fromisoformat(clean_value.replace('Z', '+00:00'))
-                # Convert to naive datetime
-                return dt.replace(tzinfo=None) if dt.tzinfo else dt
-            except:
-                pass
-
-            # Try various common formats
-            date_formats = [
-                "%Y-%m-%d",             # 2024-01-15
-                "%m/%d/%Y",             # 01/15/2024
-                "%Y-%m-%d %H:%M:%S",    # 2024-01-15 10:30:00
-                "%B %d, %Y",            # January 15, 2024
-                "%b %d, %Y",            # Jan 15, 2024
-                "%d %B %Y",             # 15 January 2024
-                "%d %b %Y",             # 15 Jan 2024
-                "%B %d %Y",             # January 15 2024 (no comma)
-                "%b %d %Y",             # Jan 15 2024 (no comma)
-                "%m-%d-%Y",             # 01-15-2024
-                "%d/%m/%Y",             # 15/01/2024 (European format)
-            ]
-
-            for fmt in date_formats:
-                try:
-                    return datetime.strptime(clean_value, fmt)
-                except ValueError:
-                    continue
+            return _parse_date_str_cached(date_value.strip())
 
         return None
     except Exception as e:
-        logger.warning(f"Error parsing date {date_value}: {e}")
+        logger.warning("Error parsing date %s: %s", date_value, e)
         return None
 
 
+@lru_cache(maxsize=2048)
+def _parse_date_str_cached(clean_value: str) -> Optional[datetime]:
+    # Order dates recur across items and tool calls; datetimes are immutable, so sharing is safe
+    # Fast paths: ISO strings (what Supabase returns) and US M/D/YYYY dates need no cleanup
+    dt = _fromisoformat(clean_value) if _is_iso_date(clean_value) else _parse_us_date(clean_value)
+    if dt is None:
+        # Clean up the string - remove ordinal suffixes (1st, 2nd, 3rd, 4th, etc.)
+        if any(suffix in clean_value for suffix in _ORDINAL_SUFFIXES):
+            clean_value = _ORDINAL_SUFFIX.sub(r'\1', clean_value)
+        dt = _fromisoformat(clean_value)
+    if dt is not None:
+        # Convert to naive datetime
+        return dt.replace(tzinfo=None) if dt.tzinfo else dt
+
+    # Try various common formats
+    return _parse_with(_DATE_PARSERS_BY_SEPARATOR[_date_separator(clean_value)], clean_value)
+
+
 def extract_brand_from_sku(sku: str) -> str:
     """
     Extract brand prefix from SKU.
@@ -165,17 +421,23 @@ def extract_brand_from_sku(sku: str) -> str:
     Returns:
         Brand prefix (uppercase) or "default" if no match
     """
-    if not sku:
+    if not sku or not isinstance(sku, str):
         return "default"
 
-    sku_upper = sku.upper().strip()
+    return _extract_brand_cached(sku.upper().strip())
 
-    # Try exact prefix matches first
-    for brand in ["PRO", "BT", "ZB", "PB"]:
-        if sku_upper.startswith(f"{brand}-") or sku_upper.startswith(brand):
-            return brand
 
-    return "default"
+# SKU brand prefixes, highest priority first (a dashed prefix like "ZB-" also starts with "ZB")
+_SKU_BRAND_PREFIXES = ("PRO", "BT", "ZB", "PB")
+# The first two characters identify the only prefix a SKU can start with
+_SKU_BRAND_BY_HEAD = {brand[:2]: brand for brand in _SKU_BRAND_PREFIXES}
+
+
+@lru_cache(maxsize=2048)
+def _extract_brand_cached(sku_upper: str) -> str:
+    # Catalog SKUs recur across orders, so most lookups are a cache hit
+    brand = _SKU_BRAND_BY_HEAD.get(sku_upper[:2])
+    return brand if brand is not None and sku_upper.startswith(brand) else "default"
 
 
 # Keyword mappings for brand detection from product names
@@ -188,6 +450,32 @@ BRAND_KEYWORD_MAPPINGS = {
 }
 
 
+def _brand_term_priorities() -> Dict[str, Tuple[int, str]]:
+    """Lower-cased SKU prefix or keyword -> (priority, brand), lowest priority wins.
+
+    SKU prefixes outrank every keyword, and brands keep their listed order within each
+    tier, so the best-ranked match anywhere in the text is what the tiered lookup found.
+    """
+    tiers = [(brand, (f"{brand.lower()}-",)) for brand in _SKU_BRAND_PREFIXES]
+    tiers += BRAND_KEYWORD_MAPPINGS.items()
+    priorities: Dict[str, Tuple[int, str]] = {}
+    for priority, (brand, terms) in enumerate(tiers):
+        for term in terms:
+            priorities.setdefault(term, (priority, brand))
+    return priorities
+
+
+_BRAND_TERM_PRIORITIES = _brand_term_priorities()
+# Zero-width lookahead so overlapping terms ("zippro") are all found; at each position the
+# best-ranked alternative is tried first. Matched against lower-cased text (not IGNORECASE),
+# so every match is exactly a key of _BRAND_TERM_PRIORITIES
+_BRAND_TERMS_RE = re.compile(
+    "(?=({}))".format("|".join(
+        re.escape(term) for term in sorted(_BRAND_TERM_PRIORITIES, key=_BRAND_TERM_PRIORITIES.get)
+    ))
+)
+
+
 def extract_brand_from_text(text: str) -> str:
     """
     Extract brand from product text (name, description, or mixed content).
@@ -214,33 +502,39 @@ def extract_brand_from_text(text: str) -> str:
     Returns:
         Brand prefix (uppercase) or "default" if no match
     """
-    if not text:
+    if not text or not isinstance(text, str):
         return "default"
 
-    text_upper = text.upper().strip()
-
-    # Step 1: Try SKU prefix match first (highest priority)
-    # Look for SKU-like patterns anywhere in the text
-    for brand in ["PRO", "BT", "ZB", "PB"]:
-        # Check for brand prefix with dash (e.g., "ZB-12R-35")
-        if f"{brand}-" in text_upper:
-            logger.debug(f"Brand detected via SKU prefix: {brand}")
-            return brand
-
-    # Step 2: Keyword matching (medium priority)
-    text_lower = text.lower()
-    for brand, keywords in BRAND_KEYWORD_MAPPINGS.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                logger.debug(f"Brand detected via keyword '{keyword}': {brand}")
-                return brand
+    return _extract_brand_from_text_cached(text)
+
+
+@lru_cache(maxsize=1024)
+def _extract_brand_from_text_cached(text: str) -> str:
+    # Screenshot product text is re-checked on every follow-up turn of a conversation
+    # Steps 1 and 2 in one scan: SKU prefixes (highest priority), then keywords
+    best = None
+    for match in _BRAND_TERMS_RE.finditer(text.lower()):
+        term = match.group(1)
+        rank = _BRAND_TERM_PRIORITIES[term]
+        if best is None or rank < best[0]:
+            best = (rank, term)
+            if rank[0] == 0:
+                break
+
+    if best is not None:
+        (priority, brand), term = best
+        if priority < len(_SKU_BRAND_PREFIXES):
+            logger.debug("Brand detected via SKU prefix: %s", brand)
+        else:
+            logger.debug("Brand detected via keyword '%s': %s", term, brand)
+        return brand
 
     # Step 3: Fallback to default
-    logger.debug(f"No brand detected in text, using default: {text[:50]}...")
+    logger.debug("No brand detected in text, using default: %s...", text[:50])
     return "default"
 
 
-def get_brand_warranty_periods(brand: str) -> Dict[str, Any]:
+def get_brand_warranty_periods(brand: str) -> BrandWarranty:
     """
     Get warranty periods for a specific brand.
 
@@ -248,10 +542,18 @@ def get_brand_warranty_periods(brand: str) -> Dict[str, Any]:
         brand: Brand prefix (ZB, PB, PRO, BT, or default)
 
     Returns:
-        Dictionary with refund_days, replacement_days, and name
+        BrandWarranty with refund_days, replacement_days, name and policy_line
     """
-    brand_upper = brand.upper() if brand else "default"
-    return BRAND_WARRANTY_CONFIG.get(brand_upper, BRAND_WARRANTY_CONFIG["default"])
+    # Codes from extract_brand_from_sku/_text are already normalized config keys
+    info = BRAND_WARRANTY_CONFIG.get(brand)
+    if info is None:
+        info = _BRAND_WARRANTY_BY_UPPER.get(brand.upper() if brand else "DEFAULT", _DEFAULT_BRAND_WARRANTY)
+    return info
+
+
+# BRAND_WARRANTY_CONFIG keyed by upper-cased brand, for callers passing any case
+_BRAND_WARRANTY_BY_UPPER = {brand.upper(): info for brand, info in BRAND_WARRANTY_CONFIG.items()}
+_DEFAULT_BRAND_WARRANTY = BRAND_WARRANTY_CONFIG["default"]
 
 
 def calculate_warranty_status(
@@ -263,7 +565,7 @@ def calculate_warranty_status(
     Calculate comprehensive warranty status for a product.
 
     Args:
-        order_date: Date of original purchase (timezone-naive)
+        order_date: Date of original purchase (timezone-naive, as returned by parse_date)
         brand: Brand prefix (ZB, PB, PRO, BT, etc.)
         current_date: Current date (defaults to now, timezone-naive)
 
@@ -274,28 +576,28 @@ def calculate_warranty_status(
         - days_since_purchase: int
         - refund_days_remaining: int
         - replacement_days_remaining: int
-        - brand_info: dict
+        - brand_info: dict with refund_days, replacement_days, name and policy_line
         - status_message: str
     """
     if current_date is None:
         # Use timezone-naive datetime for calculations
         current_date = datetime.now()
 
-    # Ensure both dates are timezone-naive for calculation
-    if hasattr(order_date, 'tzinfo') and order_date.tzinfo is not None:
-        order_date = order_date.replace(tzinfo=None)
-    if hasattr(current_date, 'tzinfo') and current_date.tzinfo is not None:
-        current_date = current_date.replace(tzinfo=None)
+    # The result depends only on the whole days elapsed and the brand; copy the cached
+    # dict (and expand brand_info per call) so callers can't mutate the shared one
+    status = dict(_warranty_status_cached((current_date - order_date).days, brand))
+    status["brand_info"] = status["brand_info"]._asdict()
+    return status
+
 
+@lru_cache(maxsize=1024)
+def _warranty_status_cached(days_since_purchase: int, brand: str) -> Dict[str, Any]:
     # Get brand-specific warranty periods
     brand_info = get_brand_warranty_periods(brand)
 
-    # Calculate days since purchase
-    days_since_purchase = (current_date - order_date).days
-
     # Calculate warranty eligibility
-    refund_days_remaining = brand_info["refund_days"] - days_since_purchase
-    replacement_days_remaining = brand_info["replacement_days"] - days_since_purchase
+    refund_days_remaining = brand_info.refund_days - days_since_purchase
+    replacement_days_remaining = brand_info.replacement_days - days_since_purchase
 
     within_refund_period = refund_days_remaining >= 0
     within_replacement_period = replacement_days_remaining >= 0
@@ -319,30 +621,56 @@ def calculate_warranty_status(
     }
 
 
-def query_rma_table(filter_field: str, filter_value: str) -> List[Dict[str, Any]]:
+def query_rma_table(
+    filter_field: str,
+    filter_value: str,
+    columns: str = RMA_FIELDS,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
     """
     Query the chromeinventory_rma table.
 
+    Goes through the shared pooled Supabase client and its short-lived result cache.
+    Email filters are matched case-insensitively on the server (see query_rma_by_email).
+
     Args:
         filter_field: Field name to filter on (e.g., "OrderNumber", "Email", "RmaNumber")
         filter_value: Value to match
+        columns: Fields to select (default: the RMA_FIELDS format_rma_status reads)
+        limit: Maximum number of records to return, newest first (default: no limit)
 
     Returns:
         List of matching RMA records
     """
-    try:
-        client = get_supabase_client()
-        response = (
-            client.table("chromeinventory_rma")
-            .select("*")
-            .eq(filter_field, filter_value)
-            .order("RmaDate", desc=True)
-            .execute()
-        )
-        return response.data
-    except Exception as e:
-        logger.error(f"❌ Error querying RMA table: {e}")
-        raise
+    if filter_field == "Email":
+        # Stored addresses aren't consistently lower-cased, so never use an exact match
+        return query_rma_by_email(filter_value, columns, limit)
+    return query_rma_records(filter_field, filter_value, columns, limit)
+
+
+# Fields format_rma_status always shows, with the placeholder used when a column is missing
+_RMA_HEADER_DEFAULTS = (
+    ("RmaNumber", "Unknown"),
+    ("ItemName", "Unknown Item"),
+    ("ReturnType", "Unknown"),
+    ("ReturnStatus", "Pending"),
+    ("Approved", 0),
+    ("RmaDate", None),
+)
+
+# Optional RMA fields appended by format_rma_status: (column, line template, value formatter)
+_RMA_OPTIONAL_FIELDS = (
+    ("ReturnTracking", "\nReturn Tracking: {}", str),
+    ("ReturnLabelSent", "\nReturn Label: Sent", None),
+    ("ReturnReceived", "\nReceived: {}", format_date),
+    ("ReturnAction", "\nAction: {}", str),
+    ("Results", "\nResolution: {}", str),
+)
+
+# Every column in one C-level call; rows selected with RMA_FIELDS have all of them
+_get_rma_columns = itemgetter(
+    *(key for key, _ in _RMA_HEADER_DEFAULTS), *(key for key, _, _ in _RMA_OPTIONAL_FIELDS)
+)
 
 
 def format_rma_status(rma_record: Dict[str, Any]) -> str:
@@ -355,52 +683,52 @@ def format_rma_status(rma_record: Dict[str, Any]) -> str:
     Returns:
         Formatted status string
     """
-    rma_number = rma_record.get("RmaNumber", "Unknown")
-    item_name = rma_record.get("ItemName", "Unknown Item")
-    return_type = rma_record.get("ReturnType", "Unknown")
-    return_status = rma_record.get("ReturnStatus", "Pending")
-    approved = rma_record.get("Approved", 0)
-    rma_date = format_date(rma_record.get("RmaDate"))
+    try:
+        values = _get_rma_columns(rma_record)
+    except KeyError:
+        # Partial row (custom column list): fall back to per-field defaults
+        values = tuple(rma_record.get(key, default) for key, default in _RMA_HEADER_DEFAULTS) + tuple(
+            rma_record.get(key) for key, _, _ in _RMA_OPTIONAL_FIELDS
+        )
+    rma_number, item_name, return_type, return_status, approved, rma_date = values[:6]
 
     # Approval status
     approval_status = "✅ Approved" if approved == 1 else "⏳ Pending Approval"
 
     # Build status message
-    status_parts = [
-        f"RMA #{rma_number}",
-        f"Item: {item_name}",
-        f"Type: {return_type}",
-        f"Status: {return_status}",
-        f"Approval: {approval_status}",
-        f"Created: {rma_date}"
-    ]
-
-    # Add tracking info if available
-    return_tracking = rma_record.get("ReturnTracking")
-    if return_tracking:
-        status_parts.append(f"Return Tracking: {return_tracking}")
-
-    # Add return label info
-    return_label_sent = rma_record.get("ReturnLabelSent")
-    if return_label_sent:
-        status_parts.append("Return Label: Sent")
-
-    # Add received date if available
-    return_received = rma_record.get("ReturnReceived")
-    if return_received:
-        status_parts.append(f"Received: {format_date(return_received)}")
-
-    # Add action taken
-    return_action = rma_record.get("ReturnAction")
-    if return_action:
-        status_parts.append(f"Action: {return_action}")
-
-    # Add results/resolution
-    results = rma_record.get("Results")
-    if results:
-        status_parts.append(f"Resolution: {results}")
-
-    return "\n".join(status_parts)
+    status = (
+        f"RMA #{rma_number}\n"
+        f"Item: {item_name}\n"
+        f"Type: {return_type}\n"
+        f"Status: {return_status}\n"
+        f"Approval: {approval_status}\n"
+        f"Created: {format_date(rma_date)}"
+    )
+
+    # Optional fields, only shown when set
+    for (_, template, formatter), value in zip(_RMA_OPTIONAL_FIELDS, values[6:]):
+        if value:
+            status += template.format(formatter(value)) if formatter else template
+
+    return status
+
+
+def _format_warranty_period_lines(warranty_status: Dict[str, Any]) -> str:
+    """Status and refund/replacement eligibility lines for one item."""
+    lines = f"  {warranty_status['status_message']}\n"
+    if warranty_status['within_refund_period']:
+        return (
+            lines
+            + f"  💰 Refund eligible: {warranty_status['refund_days_remaining']} days remaining\n"
+            + f"  🔄 Replacement eligible: {warranty_status['replacement_days_remaining']} days remaining"
+        )
+    if warranty_status['within_replacement_period']:
+        return (
+            lines
+            + f"  🔄 Replacement eligible: {warranty_status['replacement_days_remaining']} days remaining\n"
+            + "  ❌ Refund period expired"
+        )
+    return lines + "  ❌ Both refund and replacement periods expired"
 
 
 # Tool Functions (exposed to LangGraph)
@@ -432,76 +760,81 @@ def check_product_warranty_status(order_number: str) -> str:
         ..."
     """
     try:
-        logger.info(f"Checking warranty status for order: {order_number}")
+        logger.info("Checking warranty status for order: %s", order_number)
 
-        # Use shared order utilities - NO database duplication
-        from src.agent.tools.order_utils import get_order_with_items
-
-        order_data = get_order_with_items(order_number)
-
-        if not order_data:
-            return f"❌ Order #{order_number} not found. Please verify the order number and try again."
-
-        order_date_str = order_data["order_date"]
-        items = order_data["items"]
-
-        # Parse order date
-        order_date = parse_date(order_date_str)
-        if not order_date:
-            return f"❌ Unable to determine order date for order #{order_number}. Cannot calculate warranty status."
+        # One reference time per request: the cache key's day and every item's day counts
+        current_date = datetime.now()
+        cache_key = (str(order_number), current_date.date())
+        cached = _warranty_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        if not items or len(items) == 0:
-            return f"❌ No items found for order #{order_number}."
+        return _format_order_warranty(order_number, get_order_with_items(order_number), cache_key, current_date)
 
-        # Build warranty status response
-        response_parts = [
-            f"📦 Order #{order_number} Warranty Status",
-            f"📅 Purchase Date: {format_date(order_date_str)}",
-            ""
-        ]
+    except Exception as e:
+        logger.error("Error checking warranty status for order %s: %s", order_number, e)
+        return "❌ An error occurred while checking warranty status. Please try again or contact support."
 
-        for idx, item in enumerate(items, 1):
-            item_name = item.get("Name", "Unknown Item")
-            sku = item.get("SKU", "")
-            quantity = item.get("Quantity", 1)
 
+def _format_order_warranty(
+    order_number: str,
+    order_data: Optional[Dict[str, Any]],
+    cache_key: Hashable,
+    current_date: datetime
+) -> str:
+    """Build the warranty status response for an order fetched by get_order_with_items."""
+    if not order_data:
+        return f"❌ Order #{order_number} not found. Please verify the order number and try again."
+
+    order_date_str = order_data["order_date"]
+    items = order_data["items"]
+
+    # Parse order date
+    order_date = parse_date(order_date_str)
+    if not order_date:
+        return f"❌ Unable to determine order date for order #{order_number}. Cannot calculate warranty status."
+
+    if not items or len(items) == 0:
+        return f"❌ No items found for order #{order_number}."
+
+    # Items of the same brand share a purchase date, so their warranty lines are computed
+    # once; repeated SKUs (several units on separate lines) also reuse their SKU/brand lines
+    lines_by_brand: Dict[str, Tuple[str, str]] = {}
+    lines_by_sku: Dict[Any, Tuple[str, str]] = {}
+
+    def format_item(idx: int, item: Dict[str, Any]) -> str:
+        sku = item.get("SKU", "")
+        sku_lines = lines_by_sku.get(sku)
+        if sku_lines is None:
             # Extract brand and calculate warranty
             brand = extract_brand_from_sku(sku)
-            warranty_status = calculate_warranty_status(order_date, brand)
-
-            # Format item status
-            response_parts.append(f"Item {idx}: {item_name}")
-            if sku:
-                response_parts.append(f"  SKU: {sku}")
-            response_parts.append(f"  Brand: {warranty_status['brand_info']['name']}")
-            response_parts.append(f"  Quantity: {quantity}")
-            response_parts.append(f"  {warranty_status['status_message']}")
-
-            # Add detailed period info
-            if warranty_status['within_refund_period']:
-                response_parts.append(f"  💰 Refund eligible: {warranty_status['refund_days_remaining']} days remaining")
-                response_parts.append(f"  🔄 Replacement eligible: {warranty_status['replacement_days_remaining']} days remaining")
-            elif warranty_status['within_replacement_period']:
-                response_parts.append(f"  🔄 Replacement eligible: {warranty_status['replacement_days_remaining']} days remaining")
-                response_parts.append(f"  ❌ Refund period expired")
-            else:
-                response_parts.append(f"  ❌ Both refund and replacement periods expired")
-
-            response_parts.append("")  # Blank line between items
-
-        # Add warranty policy info
-        response_parts.append("📋 Warranty Policy by Brand:")
-        response_parts.append("  • Standard (ZB): 30-day refund, 365-day replacement")
-        response_parts.append("  • Performance (PB): 45-day refund, 365-day replacement")
-        response_parts.append("  • Professional (PRO): 75-day refund, 732-day replacement")
-        response_parts.append("  • Bluetooth (BT): 90-day refund, 732-day replacement")
-        response_parts.append("  • Default: 60-day refund, 549-day replacement")
-
-        return "\n".join(response_parts)
+            brand_lines = lines_by_brand.get(brand)
+            if brand_lines is None:
+                warranty_status = calculate_warranty_status(order_date, brand, current_date)
+                brand_lines = lines_by_brand[brand] = (
+                    warranty_status['brand_info']['name'],
+                    _format_warranty_period_lines(warranty_status)
+                )
+            brand_name, period_lines = brand_lines
+            sku_line = f"  SKU: {sku}\n" if sku else ""
+            sku_lines = lines_by_sku[sku] = (f"{sku_line}  Brand: {brand_name}\n", period_lines)
+        sku_brand_lines, period_lines = sku_lines
+
+        # Format item status (trailing newline leaves a blank line between items)
+        return (
+            f"Item {idx}: {item.get('Name', 'Unknown Item')}\n{sku_brand_lines}"
+            f"  Quantity: {item.get('Quantity', 1)}\n{period_lines}\n"
+        )
 
-    except Exception as e:
-        logger.error(f"Error checking warranty status for order {order_number}: {e}")
-        return f"❌ An error occurred while checking warranty status. Please try again or contact support."
+    items_block = "\n".join(format_item(idx, item) for idx, item in enumerate(items, 1))
+
+    # Build warranty status response, ending with the warranty policy info
+    return _warranty_cache.put(
+        cache_key,
+        f"📦 Order #{order_number} Warranty Status\n"
+        f"📅 Purchase Date: {format_date(order_date_str)}\n\n"
+        f"{items_block}\n{_WARRANTY_POLICY_FOOTER}"
+    )
 
 
 @tool
@@ -558,25 +891,18 @@ def check_warranty_from_order_data(
         ..."
     """
     try:
-        logger.info(f"Checking warranty from order data - date: {order_date}, platform: {platform}")
+        logger.info("Checking warranty from order data - date: %s, platform: %s", order_date, platform)
+
+        current_date = datetime.now()
 
         # Parse the order date
         parsed_date = parse_date(order_date)
         if not parsed_date:
             # Try to extract date from longer text (e.g., "Ordered on Jan 15, 2024")
-            # Common patterns in Amazon order screenshots
-            date_patterns = [
-                r'(\d{1,2}/\d{1,2}/\d{4})',  # 01/15/2024
-                r'(\d{4}-\d{2}-\d{2})',       # 2024-01-15
-                r'([A-Za-z]+ \d{1,2}, \d{4})', # January 15, 2024
-                r'([A-Za-z]{3} \d{1,2}, \d{4})', # Jan 15, 2024
-            ]
-            for pattern in date_patterns:
-                match = re.search(pattern, order_date)
-                if match:
-                    parsed_date = parse_date(match.group(1))
-                    if parsed_date:
-                        break
+            for match in _EMBEDDED_DATE_RE.finditer(order_date):
+                parsed_date = parse_date(match.group())
+                if parsed_date:
+                    break
 
         if not parsed_date:
             return (
@@ -592,59 +918,55 @@ def check_warranty_from_order_data(
         brand_info = get_brand_warranty_periods(brand)
 
         # Calculate warranty status
-        warranty_status = calculate_warranty_status(parsed_date, brand)
-
-        # Build response
-        response_parts = [
-            f"📦 {platform} Order Warranty Status",
-            f"📅 Purchase Date: {format_date(parsed_date)}",
-            f"🏪 Platform: {platform}",
-            ""
-        ]
+        warranty_status = calculate_warranty_status(parsed_date, brand, current_date)
 
         # Format product info (truncate if too long)
         items_display = items.strip()
         if len(items_display) > 200:
             items_display = items_display[:200] + "..."
 
-        response_parts.append(f"Product: {items_display}")
-        response_parts.append(f"Brand Detected: {brand_info['name']}")
-        response_parts.append(f"Days Since Purchase: {warranty_status['days_since_purchase']}")
-        response_parts.append("")
-        response_parts.append(f"📋 Warranty Status:")
-        response_parts.append(f"   {warranty_status['status_message']}")
-
-        # Add detailed period info
+        # Detailed period info
         if warranty_status['within_refund_period']:
-            response_parts.append(f"   💰 Refund eligible: {warranty_status['refund_days_remaining']} days remaining")
-            response_parts.append(f"   🔄 Replacement eligible: {warranty_status['replacement_days_remaining']} days remaining")
+            period_lines = (
+                f"   💰 Refund eligible: {warranty_status['refund_days_remaining']} days remaining\n"
+                f"   🔄 Replacement eligible: {warranty_status['replacement_days_remaining']} days remaining"
+            )
         elif warranty_status['within_replacement_period']:
-            response_parts.append(f"   🔄 Replacement eligible: {warranty_status['replacement_days_remaining']} days remaining")
-            response_parts.append(f"   ❌ Refund period expired ({abs(warranty_status['refund_days_remaining'])} days ago)")
+            period_lines = (
+                f"   🔄 Replacement eligible: {warranty_status['replacement_days_remaining']} days remaining\n"
+                f"   ❌ Refund period expired ({abs(warranty_status['refund_days_remaining'])} days ago)"
+            )
         else:
-            response_parts.append(f"   ❌ Both refund and replacement periods expired")
-            response_parts.append(f"   ⏰ Warranty expired {abs(warranty_status['replacement_days_remaining'])} days ago")
-
-        response_parts.append("")
-
-        # Add warranty policy for detected brand
-        response_parts.append(f"📋 {brand_info['name']} Warranty Policy:")
-        response_parts.append(f"   • Refund Period: {brand_info['refund_days']} days from purchase")
-        response_parts.append(f"   • Replacement Period: {brand_info['replacement_days']} days from purchase")
+            period_lines = (
+                "   ❌ Both refund and replacement periods expired\n"
+                f"   ⏰ Warranty expired {abs(warranty_status['replacement_days_remaining'])} days ago"
+            )
 
-        # Add note about brand detection if using default
-        if brand == "default":
-            response_parts.append("")
-            response_parts.append("💡 Note: Could not detect specific brand from product info.")
-            response_parts.append("   Default warranty periods applied. If you have the product SKU,")
-            response_parts.append("   please provide it for more accurate warranty information.")
+        response = (
+            f"📦 {platform} Order Warranty Status\n"
+            f"📅 Purchase Date: {format_date(parsed_date)}\n"
+            f"🏪 Platform: {platform}\n"
+            "\n"
+            f"Product: {items_display}\n"
+            f"Brand Detected: {brand_info.name}\n"
+            f"Days Since Purchase: {warranty_status['days_since_purchase']}\n"
+            "\n"
+            "📋 Warranty Status:\n"
+            f"   {warranty_status['status_message']}\n"
+            f"{period_lines}\n"
+            "\n"
+            f"{_EXTERNAL_ORDER_POLICY_BLOCKS[brand]}"
+        )
 
-        logger.info(f"Warranty check complete - brand: {brand}, within_refund: {warranty_status['within_refund_period']}, within_replacement: {warranty_status['within_replacement_period']}")
-        return "\n".join(response_parts)
+        logger.info(
+            "Warranty check complete - brand: %s, within_refund: %s, within_replacement: %s",
+            brand, warranty_status['within_refund_period'], warranty_status['within_replacement_period']
+        )
+        return response
 
     except Exception as e:
-        logger.error(f"Error checking warranty from order data: {e}")
-        return f"❌ An error occurred while checking warranty status. Please try again or provide additional order details."
+        logger.error("Error checking warranty from order data: %s", e)
+        return "❌ An error occurred while checking warranty status. Please try again or provide additional order details."
 
 
 @tool
@@ -673,30 +995,94 @@ def lookup_rma_by_order(order_number: str) -> str:
         ..."
     """
     try:
-        logger.info(f"Looking up RMA records for order: {order_number}")
+        logger.info("Looking up RMA records for order: %s", order_number)
 
         # Query RMA table by order number
-        rma_records = query_rma_table("OrderNumber", str(order_number))
+        return _format_rma_by_order(order_number, query_rma_table("OrderNumber", str(order_number)))
 
-        if not rma_records or len(rma_records) == 0:
-            return f"📋 No RMA records found for order #{order_number}. If you need to initiate a return or replacement, please contact our support team."
+    except Exception as e:
+        logger.error("Error looking up RMA for order %s: %s", order_number, e)
+        return _RMA_LOOKUP_ERROR
 
-        # Build response
-        response_parts = [
-            f"📋 Found {len(rma_records)} RMA record(s) for order #{order_number}:",
-            ""
-        ]
 
-        for idx, rma in enumerate(rma_records, 1):
-            response_parts.append(f"--- RMA Record {idx} ---")
-            response_parts.append(format_rma_status(rma))
-            response_parts.append("")
+def _format_rma_by_order(order_number: str, rma_records: List[Dict[str, Any]]) -> str:
+    """Build the RMA listing response for an order's chromeinventory_rma records."""
+    if not rma_records or len(rma_records) == 0:
+        return f"📋 No RMA records found for order #{order_number}. If you need to initiate a return or replacement, please contact our support team."
+
+    # Build response: header, blank line, then each record followed by a blank line
+    records = "\n".join(
+        f"--- RMA Record {idx} ---\n{format_rma_status(rma)}\n"
+        for idx, rma in enumerate(rma_records, 1)
+    )
+    return f"📋 Found {len(rma_records)} RMA record(s) for order #{order_number}:\n\n{records}"
+
+
+def _fetch_order_and_rma(
+    order_number: str
+) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Fetch an order (with items) and its RMA records with as few round trips as possible.
+
+    Uses the get_order_warranty_bundle() server function (one round trip) when it is
+    enabled with SUPABASE_WARRANTY_BUNDLE_RPC and succeeds. Otherwise the RMA lookup runs
+    on a worker thread while the order is fetched, so the two PostgREST round trips overlap.
+
+    Returns:
+        Tuple of (order data as returned by get_order_with_items, RMA records)
+    """
+    bundle = get_order_warranty_bundle(order_number)
+    if bundle is not None:
+        order = bundle["order"]
+        return (build_order_with_items(order, bundle["items"]) if order else None), bundle["rmas"]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        rma_future = executor.submit(query_rma_table, "OrderNumber", str(order_number))
+        order_data = get_order_with_items(order_number)
+        return order_data, rma_future.result()
+
+
+@tool
+def check_order_warranty_and_rma(order_number: str) -> str:
+    """
+    Check warranty status and existing RMA records for an order in one call.
+
+    Use this instead of calling check_product_warranty_status and then
+    lookup_rma_by_order when a customer asks about both warranty coverage and
+    return/replacement status for the same order. The order and RMA lookups
+    run concurrently.
 
-        return "\n".join(response_parts)
+    Args:
+        order_number: The order number to check (e.g., "417698")
+
+    Returns:
+        The warranty status for every item in the order, followed by any RMA
+        records for the order.
+
+    Examples:
+        >>> check_order_warranty_and_rma("417698")
+        "📦 Order #417698 Warranty Status
+        ...
+        📋 Found 1 RMA record(s) for order #417698:
+        ..."
+    """
+    try:
+        logger.info("Checking warranty and RMA status for order: %s", order_number)
+
+        # One reference time per request: the cache key's day and every item's day counts
+        current_date = datetime.now()
+        cache_key = (str(order_number), current_date.date())
+        warranty_response = _warranty_cache.get(cache_key)
+        if warranty_response is None:
+            order_data, rma_records = _fetch_order_and_rma(order_number)
+            warranty_response = _format_order_warranty(order_number, order_data, cache_key, current_date)
+        else:
+            rma_records = query_rma_table("OrderNumber", str(order_number))
+
+        return f"{warranty_response}\n\n{_format_rma_by_order(order_number, rma_records)}"
 
     except Exception as e:
-        logger.error(f"Error looking up RMA for order {order_number}: {e}")
-        return f"❌ An error occurred while looking up RMA records. Please try again or contact support."
+        logger.error("Error checking warranty and RMA status for order %s: %s", order_number, e)
+        return "❌ An error occurred while checking warranty and return status. Please try again or contact support."
 
 
 @tool
@@ -724,7 +1110,7 @@ def lookup_rma_by_email(email: str) -> str:
         ..."
     """
     try:
-        logger.info(f"Looking up RMA records for email: {email}")
+        logger.info("Looking up RMA records for email: %s", email)
 
         # Query RMA table by email with case-insensitive matching
         # This fixes the issue where mixed-case emails (e.g., "Erniedavis1979@gmail.com")
@@ -734,23 +1120,16 @@ def lookup_rma_by_email(email: str) -> str:
         if not rma_records or len(rma_records) == 0:
             return f"📋 No RMA records found for {email}. If you need to initiate a return or replacement, please contact our support team."
 
-        # Build response
-        response_parts = [
-            f"📋 Found {len(rma_records)} RMA record(s) for {email}:",
-            ""
-        ]
-
-        for idx, rma in enumerate(rma_records, 1):
-            order_number = rma.get("OrderNumber", "Unknown")
-            response_parts.append(f"--- RMA Record {idx} (Order #{order_number}) ---")
-            response_parts.append(format_rma_status(rma))
-            response_parts.append("")
-
-        return "\n".join(response_parts)
+        # Build response: header, blank line, then each record followed by a blank line
+        records = "\n".join(
+            f"--- RMA Record {idx} (Order #{rma.get('OrderNumber', 'Unknown')}) ---\n{format_rma_status(rma)}\n"
+            for idx, rma in enumerate(rma_records, 1)
+        )
+        return f"📋 Found {len(rma_records)} RMA record(s) for {email}:\n\n{records}"
 
     except Exception as e:
-        logger.error(f"Error looking up RMA for email {email}: {e}")
-        return f"❌ An error occurred while looking up RMA records. Please try again or contact support."
+        logger.error("Error looking up RMA for email %s: %s", email, e)
+        return _RMA_LOOKUP_ERROR
 
 
 @tool
@@ -780,10 +1159,14 @@ def get_rma_status(rma_number: str) -> str:
         ..."
     """
     try:
-        logger.info(f"Getting status for RMA: {rma_number}")
+        logger.info("Getting status for RMA: %s", rma_number)
+
+        cached = _rma_status_cache.get(rma_number)
+        if cached is not None:
+            return cached
 
         # Query RMA table by RMA number
-        rma_records = query_rma_table("RmaNumber", rma_number.strip())
+        rma_records = query_rma_table("RmaNumber", rma_number.strip(), limit=1)
 
         if not rma_records or len(rma_records) == 0:
             return f"❌ RMA #{rma_number} not found. Please verify the RMA number and try again."
@@ -791,25 +1174,18 @@ def get_rma_status(rma_number: str) -> str:
         rma = rma_records[0]
 
         # Build detailed response
-        response_parts = [
-            f"📋 RMA #{rma_number} Detailed Status:",
-            ""
-        ]
-
-        # Add formatted status
-        response_parts.append(format_rma_status(rma))
+        response = f"📋 RMA #{rma_number} Detailed Status:\n\n{format_rma_status(rma)}"
 
         # Add additional details if available
         order_number = rma.get("OrderNumber")
         if order_number:
-            response_parts.append("")
-            response_parts.append(f"💡 To check warranty status for this order, use order number: {order_number}")
+            response += f"\n\n💡 To check warranty status for this order, use order number: {order_number}"
 
-        return "\n".join(response_parts)
+        return _rma_status_cache.put(rma_number, response)
 
     except Exception as e:
-        logger.error(f"Error getting RMA status for {rma_number}: {e}")
-        return f"❌ An error occurred while retrieving RMA status. Please try again or contact support."
+        logger.error("Error getting RMA status for %s: %s", rma_number, e)
+        return "❌ An error occurred while retrieving RMA status. Please try again or contact support."
 
 
 @tool
@@ -843,55 +1219,16 @@ def get_brand_warranty_info(brand: str = "all") -> str:
         ..."
     """
     try:
-        logger.info(f"Getting warranty info for brand: {brand}")
-
-        brand_upper = brand.upper().strip()
-
-        if brand_upper == "ALL":
-            # Show all brand warranties
-            response_parts = [
-                "🛡️ ChromeBattery Warranty Policies by Brand:",
-                "",
-                "Our warranty coverage varies by product line to ensure the best",
-                "protection for your specific battery type.",
-                ""
-            ]
-
-            for brand_key in ["ZB", "PB", "PRO", "BT", "default"]:
-                brand_info = BRAND_WARRANTY_CONFIG[brand_key]
-                response_parts.append(f"📦 {brand_info['name']}:")
-                response_parts.append(f"   • Refund Period: {brand_info['refund_days']} days from purchase")
-                response_parts.append(f"   • Replacement Period: {brand_info['replacement_days']} days from purchase")
-                response_parts.append("")
-
-            response_parts.append("💡 Tips:")
-            response_parts.append("   • Refund period allows full money-back returns")
-            response_parts.append("   • Replacement period covers warranty exchanges")
-            response_parts.append("   • Brand is determined by product SKU (e.g., ZB-12R-35 is Standard)")
+        logger.info("Getting warranty info for brand: %s", brand)
 
-        else:
-            # Show specific brand warranty
-            brand_info = get_brand_warranty_periods(brand_upper)
-
-            response_parts = [
-                f"🛡️ Warranty Policy for {brand_info['name']}:",
-                "",
-                f"📅 Refund Period: {brand_info['refund_days']} days from purchase date",
-                f"   Full refund available for returns within this period",
-                "",
-                f"🔄 Replacement Period: {brand_info['replacement_days']} days from purchase date",
-                f"   Warranty replacement available for defective items",
-                "",
-                "💡 Note:",
-                "   • Warranty period starts from the original purchase date",
-                "   • Refund period is shorter than replacement period",
-                "   • Items must meet return conditions (see our return policy)",
-            ]
-
-        return "\n".join(response_parts)
+        # Every input maps to a prebuilt response; unknown brands get the default policy
+        response = _BRAND_WARRANTY_INFO.get(brand)
+        if response is None:
+            response = _BRAND_WARRANTY_INFO.get(brand.upper().strip(), _BRAND_WARRANTY_INFO["DEFAULT"])
+        return response
 
     except Exception as e:
-        logger.error(f"Error getting brand warranty info: {e}")
+        logger.error("Error getting brand warranty info: %s", e)
         return "❌ An error occurred while retrieving warranty information. Please try again."
 
 
@@ -900,6 +1237,7 @@ __all__ = [
     "check_product_warranty_status",
     "check_warranty_from_order_data",  # For Amazon/external orders without database records
     "lookup_rma_by_order",
+    "check_order_warranty_and_rma",  # Warranty + RMA lookups for one order, run concurrently
     "lookup_rma_by_email",
     "get_rma_status",
     "get_brand_warranty_info"